@@ -0,0 +1,10 @@
+# Loaded with -c from render.yaml's startCommand.
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    """
+    Drops an exited worker's live gauges (in-flight requests, pool
+    occupancy) from /metrics; see breate_backend/metrics.py.
+    """
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,10 +1,15 @@
+import hashlib
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from jose import jwt, JWTError, ExpiredSignatureError
 from dotenv import load_dotenv
 from fastapi import HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
+from breate_backend.cache import TTLCache
 from breate_backend.database import get_db
 from breate_backend import models
 
@@ -20,6 +25,13 @@ ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 15))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
 
+# Identity cache (per worker; keep the TTL short, see cache.py)
+IDENTITY_CACHE_TTL_SECONDS = float(os.getenv("IDENTITY_CACHE_TTL_SECONDS", 30))
+IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", 4096))
+
+# Verified access-token memo (entries live until the token's own exp)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
 
@@ -51,10 +63,24 @@ def create_refresh_token(data: dict):
 # ------------------------------------------
 # Verify Tokens
 # ------------------------------------------
+# The frontend resends the same access token for its whole lifetime, so
+# successful verifications are memoized by token digest until `exp`.
+# Failures are never cached.
+token_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
 def verify_access_token(token: str):
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            token_cache.set(key, payload, ttl=exp - time.time())
+        return dict(payload)
     except ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access token has expired")
     except JWTError:
@@ -71,6 +97,88 @@ def verify_refresh_token(token: str):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
 
+# ------------------------------------------
+# Identity cache
+# ------------------------------------------
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
+    """
+    Snapshot of the authenticated user shared by every protected route.
+    Not attached to a session: query models.User by id to modify the row.
+    """
+    id: int
+    email: str
+    username: str | None
+    bio: str | None
+    archetype_id: int | None
+    tier_id: int | None
+
+
+identity_cache = TTLCache(maxsize=IDENTITY_CACHE_SIZE, ttl=IDENTITY_CACHE_TTL_SECONDS)
+
+
+def token_claims(user) -> dict:
+    """
+    Subject claims for a user's tokens; `uid` lets lookups use the primary key.
+    """
+    return {"sub": user.email, "uid": user.id}
+
+
+def invalidate_user(user_id: int, email: str | None = None):
+    """
+    Drops a user's cached identity in this worker. Call after any change to
+    the profile or credentials; other workers expire it within the TTL.
+    """
+    identity_cache.pop(("uid", user_id))
+    if email:
+        identity_cache.pop(("email", email))
+
+
+@event.listens_for(models.User, "after_delete")
+def forget_deleted_user(mapper, connection, target):
+    # Session deletes only; a bulk DELETE must call invalidate_user() itself
+    invalidate_user(target.id, target.email)
+
+
+def resolve_user(payload: dict, db: Session) -> CurrentUser | None:
+    """
+    Maps verified token claims to a CurrentUser, hitting the database only
+    on a cache miss. Tokens minted before `uid` existed fall back to email.
+    """
+    email = payload.get("sub")
+    user_id = payload.get("uid")
+    if not email:
+        return None
+
+    key = ("uid", user_id) if user_id is not None else ("email", email)
+    user = identity_cache.get(key)
+    if user is None:
+        stmt = select(
+            models.User.id,
+            models.User.email,
+            models.User.username,
+            models.User.bio,
+            models.User.archetype_id,
+            models.User.tier_id,
+        )
+        if user_id is not None:
+            stmt = stmt.where(models.User.id == user_id)
+        else:
+            stmt = stmt.where(models.User.email == email)
+
+        row = db.execute(stmt).first()
+        if row is None:
+            return None
+
+        user = CurrentUser(*row)
+        identity_cache.set(key, user)
+
+    if user.email != email:
+        return None
+
+    return user
+
+
 # ------------------------------------------
 # Current User Dependency
 # ------------------------------------------
@@ -81,7 +189,7 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if not email:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = resolve_user(payload, db)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -0,0 +1,69 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from breate_backend.database import SessionLocal
+from breate_backend import models
+from breate_backend.queries import link_project_archetypes, link_project_coalitions
+
+BATCH_SIZE = 500
+
+
+def backfill_links(db: Session, links, tags_column, link, label: str):
+    """
+    Fills a project link table for projects created before it existed.
+    Safe to re-run: only projects without links are touched.
+    """
+    last_id = 0
+    linked = 0
+
+    while True:
+        rows = db.execute(
+            select(models.Project.id, tags_column)
+            .where(
+                models.Project.id > last_id,
+                ~select(links.c.project_id)
+                .where(links.c.project_id == models.Project.id)
+                .exists(),
+            )
+            .order_by(models.Project.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        for project_id, tags in rows:
+            link(db, project_id, (tags or "").split(","))
+        db.commit()
+
+        linked += len(rows)
+        last_id = rows[-1].id
+
+    print(f"✅ {label} links backfilled ({linked} projects checked)")
+
+
+def backfill():
+    db: Session = SessionLocal()
+    try:
+        backfill_links(
+            db,
+            models.project_archetypes,
+            models.Project.needed_archetypes,
+            link_project_archetypes,
+            "Archetype",
+        )
+        backfill_links(
+            db,
+            models.project_coalitions,
+            models.Project.coalition_tags,
+            link_project_coalitions,
+            "Coalition",
+        )
+    except Exception as e:
+        db.rollback()
+        print("❌ Error backfilling links:", e)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill()
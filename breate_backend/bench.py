@@ -0,0 +1,355 @@
+"""
+Local micro-benchmarks against a throwaway SQLite database.
+
+    python -m breate_backend.bench rows [--n 10000]
+    python -m breate_backend.bench serialize [--n 5000]
+    python -m breate_backend.bench hashing [--n 32]
+    python -m breate_backend.bench load [--n 2000] [--concurrency 64] [--latency-ms 20]
+    python -m breate_backend.bench load --n 1000 --concurrency 100 --latency-ms 500
+
+Numbers are for comparing code paths on one machine, not for capacity
+planning against Neon.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+# Never point a benchmark at the real DATABASE_URL from .env
+_db_file = os.path.join(tempfile.mkdtemp(prefix="breate-bench-"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+# Injected latency would otherwise fill the slow-query log (and run EXPLAIN)
+os.environ.setdefault("SLOW_QUERY_MS", "1000000")
+
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from breate_backend import models  # noqa: E402
+from breate_backend.database import SessionLocal, engine  # noqa: E402
+from breate_backend.queries import (  # noqa: E402
+    ProjectCard,
+    UserCard,
+    fetch,
+    project_cards,
+    user_cards,
+)
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def measure(fn, repeat: int = 3):
+    """
+    Returns (best wall time in ms, peak traced memory in KiB).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak / 1024
+
+
+def report(name: str, before, after):
+    print(f"{name}")
+    print(f"  before: {before[0]:8.1f} ms  {before[1]:10.0f} KiB peak")
+    print(f"  after:  {after[0]:8.1f} ms  {after[1]:10.0f} KiB peak")
+
+
+def seed(n: int):
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.add_all([
+            models.Archetype(id=1, name="Creator"),
+            models.Tier(id=1, name="Base", level=1),
+        ])
+        db.flush()
+        long_text = "lorem ipsum " * 40
+        db.add_all([
+            models.User(
+                email=f"user{i}@example.com",
+                password="$argon2id$v=19$m=65536,t=3,p=4$" + "x" * 64,
+                username=f"user{i}",
+                bio="bio",
+                preferred_themes=long_text,
+                portfolio_links=long_text,
+                next_build=long_text,
+                affiliations=long_text,
+                archetype_id=1,
+                tier_id=1,
+            )
+            for i in range(n)
+        ])
+        db.add_all([
+            models.Project(
+                title=f"Project {i}",
+                objective=long_text,
+                project_type="open-source",
+                needed_archetypes="Creator,Innovator",
+                region="Ghana",
+                coalition_tags="Tech for Good",
+            )
+            for i in range(n)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+# -------------------------------------------------
+# rows: ORM entities vs column projection + slotted DTOs
+# -------------------------------------------------
+def bench_rows(n: int):
+    seed(n)
+
+    def users_before():
+        db = SessionLocal()
+        users = (
+            db.query(models.User)
+            .options(joinedload(models.User.archetype), joinedload(models.User.tier))
+            .all()
+        )
+        out = [
+            {
+                "id": u.id,
+                "username": u.username,
+                "bio": u.bio,
+                "archetype": u.archetype.name if u.archetype else None,
+                "tier": u.tier.name if u.tier else None,
+            }
+            for u in users
+        ]
+        db.close()
+        return out
+
+    def users_after():
+        db = SessionLocal()
+        out = fetch(db, user_cards(), UserCard)
+        db.close()
+        return out
+
+    def projects_before():
+        db = SessionLocal()
+        projects = db.query(models.Project).all()
+        out = [
+            {
+                "id": p.id,
+                "title": p.title,
+                "objective": p.objective,
+                "project_type": p.project_type,
+                "needed_archetypes": p.needed_archetypes.split(","),
+                "open_roles": p.open_roles,
+                "timeline": p.timeline,
+                "region": p.region,
+                "coalition_tags": p.coalition_tags.split(",") if p.coalition_tags else [],
+                "poster_id": p.poster_id,
+                "status": p.status.value,
+                "created_at": p.created_at,
+            }
+            for p in projects
+        ]
+        db.close()
+        return out
+
+    def projects_after():
+        db = SessionLocal()
+        out = fetch(db, project_cards(), ProjectCard)
+        db.close()
+        return out
+
+    print(f"rows: {n} users / {n} projects")
+    report("discover users", measure(users_before), measure(users_after))
+    report("project feed", measure(projects_before), measure(projects_after))
+
+
+# -------------------------------------------------
+# serialize: hand-built models + response_model vs precompiled adapter
+# -------------------------------------------------
+def bench_serialize(n: int):
+    from datetime import datetime
+
+    from pydantic import TypeAdapter
+
+    from breate_backend.routers.projects import ProjectResponse
+    from breate_backend.serializers import PROJECT_CARDS
+
+    cards = [
+        ProjectCard(
+            i, f"Project {i}", "lorem ipsum " * 40, "open-source",
+            ["Creator", "Innovator"], None, None, "Ghana", ["Tech for Good"],
+            1, "open", datetime.utcnow(),
+        )
+        for i in range(n)
+    ]
+    response_field = TypeAdapter(list[ProjectResponse])
+
+    def before():
+        # Old get_projects: build models by hand, then FastAPI validates
+        # them against response_model, dumps to JSON-able Python, json.dumps
+        items = [
+            ProjectResponse(
+                id=c.id,
+                title=c.title,
+                objective=c.objective,
+                project_type=c.project_type,
+                needed_archetypes=c.needed_archetypes,
+                open_roles=c.open_roles,
+                timeline=c.timeline,
+                region=c.region,
+                coalition_tags=c.coalition_tags,
+                poster_id=c.poster_id,
+                status=c.status,
+                created_at=c.created_at,
+            )
+            for c in cards
+        ]
+        validated = response_field.validate_python(items, from_attributes=True)
+        content = response_field.dump_python(validated, mode="json")
+        return json.dumps(content, separators=(",", ":")).encode()
+
+    def after():
+        return PROJECT_CARDS.dump_json(cards)
+
+    print(f"serialize: {n} projects")
+    report("project list payload", measure(before), measure(after))
+
+
+# -------------------------------------------------
+# hashing: argon2 throughput at different pool caps
+# -------------------------------------------------
+def bench_hashing(n: int):
+    from breate_backend.passwords import HashingPool, pwd_context
+
+    print(f"hashing: {n} argon2 hashes per cap, {os.cpu_count()} CPUs")
+    for cap in (1, 2, 4, 8):
+        pool = HashingPool(cap, queue_limit=n, queue_timeout=float("inf"))
+        start = time.perf_counter()
+        futures = [pool.submit(pwd_context.hash, "correct horse battery") for _ in range(n)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+        print(f"  cap {cap}: {n / elapsed:7.1f} hashes/s  {elapsed / n * 1000:7.1f} ms avg")
+
+
+# -------------------------------------------------
+# load: sync route + threadpool vs async route + AsyncSession
+# -------------------------------------------------
+def bench_load(n: int, concurrency: int, latency_ms: float):
+    import asyncio
+    import statistics
+
+    import httpx
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    from sqlalchemy.util import await_only
+
+    from breate_backend.database import async_engine, get_db
+    from breate_backend.pagination import paginate
+    from breate_backend.routers import projects
+    from breate_backend.serializers import PROJECT_PAGE, Page, render
+
+    seed(1_000)
+
+    # Stand-in for the network round trip to Neon, paid per statement
+    delay = latency_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def sync_latency(*_):
+        time.sleep(delay)
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def async_latency(*_):
+        await_only(asyncio.sleep(delay))
+
+    app = FastAPI()
+    app.include_router(projects.router)
+
+    @app.get("/sync-feed")
+    def sync_feed(db: Session = Depends(get_db)):
+        # The feed as it was before: sync def on the AnyIO threadpool
+        rows, next_cursor = paginate(db, project_cards(), projects.FEED_ORDER, None, 20, descending=True)
+        return render(PROJECT_PAGE, Page([ProjectCard.from_row(r) for r in rows], next_cursor))
+
+    @app.get("/probe")
+    def probe():
+        # Any sync def route (token refresh, /users/me, health) needs a
+        # free AnyIO thread, like this one
+        return {"ok": True}
+
+    def percentiles(samples: list[float]) -> tuple[float, float]:
+        samples = sorted(samples)
+        return statistics.median(samples) * 1000, samples[int(len(samples) * 0.95)] * 1000
+
+    async def drive(url: str):
+        latencies, probes = [], []
+        remaining = iter(range(n))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def worker():
+                for _ in remaining:
+                    start = time.perf_counter()
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+
+            async def prober():
+                while True:
+                    start = time.perf_counter()
+                    (await client.get("/probe")).raise_for_status()
+                    probes.append(time.perf_counter() - start)
+                    await asyncio.sleep(0.05)
+
+            probing = asyncio.create_task(prober())
+            start = time.perf_counter()
+            await asyncio.gather(*[worker() for _ in range(concurrency)])
+            elapsed = time.perf_counter() - start
+            probing.cancel()
+
+        # aiosqlite connections run on their own threads; close them so
+        # the process can exit
+        await async_engine.dispose()
+
+        return n / elapsed, *percentiles(latencies), *percentiles(probes)
+
+    pool = engine.pool
+    print(
+        f"load: {n} feed requests, {concurrency} concurrent, {latency_ms} ms per statement, "
+        f"1 worker, pool {pool.size()}+{pool._max_overflow} per engine"
+    )
+    for name, url in (("sync def + Session", "/sync-feed"), ("async def + AsyncSession", "/projects/?limit=20")):
+        rps, p50, p95, probe_p50, probe_p95 = asyncio.run(drive(url))
+        print(
+            f"  {name:26} {rps:8.1f} req/s  p50 {p50:7.1f} ms  p95 {p95:7.1f} ms"
+            f"  | sync probe p50 {probe_p50:7.1f} ms  p95 {probe_p95:7.1f} ms"
+        )
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suite", choices=["rows", "serialize", "hashing", "load"])
+    parser.add_argument("--n", type=int)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    if args.suite == "rows":
+        bench_rows(args.n or 10_000)
+    elif args.suite == "serialize":
+        bench_serialize(args.n or 5_000)
+    elif args.suite == "hashing":
+        bench_hashing(args.n or 32)
+    elif args.suite == "load":
+        bench_load(args.n or 2_000, args.concurrency, args.latency_ms)
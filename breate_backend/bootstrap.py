@@ -0,0 +1,223 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import inspect, select
+
+from breate_backend import models, passwords, reference
+from breate_backend.database import SessionLocal, engine, prewarm_all
+from breate_backend.queries import insert_or_skip
+
+# -------------------------------------------------
+# Config
+# -------------------------------------------------
+# Turn off once the schema is managed elsewhere (e.g. migrations)
+DB_BOOTSTRAP_SCHEMA = os.getenv("DB_BOOTSTRAP_SCHEMA", "1").lower() in ("1", "true", "yes")
+
+# How long a request that arrives before warm-up finishes waits for it
+STARTUP_WAIT_SECONDS = float(os.getenv("STARTUP_WAIT_SECONDS", 30))
+
+# =====================================================
+# Startup state
+# =====================================================
+# The lifespan handler in main.py starts warm_up() in the background and
+# serves straight away: /health/ready answers 503 until every phase has
+# run, so a load balancer keeps traffic off the worker meanwhile. Other
+# requests that get through anyway wait for warm-up (see main.py) rather
+# than racing the schema and seed steps.
+#
+# Times are measured from main.py's first line (main sets `began`), which
+# runs within a few tens of ms of interpreter start.
+
+
+@dataclass(slots=True)
+class Startup:
+    began: float = field(default_factory=time.perf_counter)
+    ready: bool = False
+    ready_ms: float | None = None
+    phases_ms: dict = field(default_factory=dict)
+    attempts: int = 0
+    error: str | None = None
+    first_response: dict | None = None
+    done: asyncio.Event | None = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.began) * 1000
+
+    def note_response(self, route: str, duration_ms: float):
+        """
+        Records the first application request served after warm-up.
+        """
+        if self.ready and self.first_response is None:
+            self.first_response = {
+                "route": route,
+                "duration_ms": round(duration_ms, 1),
+                "since_start_ms": round(self.elapsed_ms(), 1),
+            }
+
+    def report(self) -> dict:
+        return {
+            "status": "ready" if self.ready else "starting",
+            "ready_after_ms": self.ready_ms,
+            "phases_ms": self.phases_ms,
+            "attempts": self.attempts,
+            "error": self.error,
+            "first_response": self.first_response,
+        }
+
+
+startup = Startup()
+
+
+# -------------------------------------------------
+# Schema
+# -------------------------------------------------
+def ensure_schema():
+    """
+    Creates missing tables and indexes with one table listing and one
+    index reflection, instead of a has_table/has_index round trip per
+    object. The metadata create hooks (pg_trgm, project search) still run.
+    """
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing = set(inspector.get_table_names())
+        tables = models.Base.metadata.sorted_tables
+
+        # create_all() skips indexes on tables that already exist
+        present = [table for table in tables if table.name in existing]
+        indexed = set()
+        if present:
+            reflected = inspector.get_multi_indexes(filter_names=[table.name for table in present])
+            indexed = {index["name"] for indexes in reflected.values() for index in indexes}
+
+        models.Base.metadata.create_all(
+            conn,
+            tables=[table for table in tables if table.name not in existing],
+            checkfirst=False,
+        )
+
+        for table in present:
+            for index in table.indexes:
+                if index.name not in indexed:
+                    index.create(conn)
+
+
+# -------------------------------------------------
+# Seed core reference data (idempotent)
+# -------------------------------------------------
+ARCHETYPES = [
+    ("Creator", "Visionary builders who bring ideas to life."),
+    ("Creative", "Expressive individuals skilled in storytelling and design."),
+    ("Innovator", "Thinkers who challenge norms and create new approaches."),
+    ("Systems Thinker", "Analytical minds who design scalable systems."),
+]
+
+TIERS = [
+    ("Base", 1, "Entry-level creators starting out."),
+    ("Standard", 2, "Intermediate users gaining experience."),
+    ("Professional", 3, "Experts with consistent contributions."),
+]
+
+COALITIONS = [
+    ("University of Ghana", "Academic creative ecosystem", "Education", "Ghana"),
+    ("Tech for Good", "Builders using tech for social impact", "Innovation", "Africa"),
+]
+
+
+def seed_reference_data():
+    """
+    Three statements plus an insert only when a coalition is missing:
+    archetype and tier names are unique, so they go in with ON CONFLICT
+    DO NOTHING; coalition names are not, so existing ones are looked up.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(
+            insert_or_skip(db, models.Archetype.__table__, ["name"]),
+            [{"name": name, "description": description} for name, description in ARCHETYPES],
+        )
+        db.execute(
+            insert_or_skip(db, models.Tier.__table__, ["name"]),
+            [
+                {"name": name, "level": level, "description": description}
+                for name, level, description in TIERS
+            ],
+        )
+
+        names = [name for name, *_ in COALITIONS]
+        existing = set(
+            db.scalars(select(models.Coalition.name).where(models.Coalition.name.in_(names)))
+        )
+        db.add_all(
+            models.Coalition(name=name, description=description, focus=focus, location=location)
+            for name, description, focus, location in COALITIONS
+            if name not in existing
+        )
+
+        db.commit()
+    finally:
+        db.close()
+
+
+def warm_caches():
+    # Read from the primary: a replica may not have the seed rows yet
+    db = SessionLocal()
+    try:
+        reference.warm(db)
+    finally:
+        db.close()
+
+
+# =====================================================
+# Warm-up
+# =====================================================
+async def run_phase(name: str, fn, *args):
+    started = time.perf_counter()
+    await fn(*args)
+    startup.phases_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def warm_up():
+    """
+    Runs every startup phase, retrying with backoff (e.g. while a sleeping
+    Neon compute wakes up), then marks the worker ready.
+    """
+    startup.done = startup.done or asyncio.Event()
+    startup.phases_ms["import"] = round(startup.elapsed_ms(), 1)
+
+    while True:
+        startup.attempts += 1
+        try:
+            await run_phase("pool_prewarm", prewarm_all)
+            if DB_BOOTSTRAP_SCHEMA:
+                await run_phase("schema", asyncio.to_thread, ensure_schema)
+            await run_phase("seed", asyncio.to_thread, seed_reference_data)
+            await run_phase("caches", asyncio.to_thread, warm_caches)
+            if passwords.ARGON2_AUTO_CALIBRATE:
+                await run_phase("password_hashing", asyncio.to_thread, passwords.auto_calibrate)
+            break
+        except Exception as exc:
+            # Only the type is reported on /health/ready; details go to the log
+            startup.error = type(exc).__name__
+            delay = min(2 ** startup.attempts, 30)
+            print(f"❌ Startup attempt {startup.attempts} failed ({startup.error}: {exc}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+    startup.error = None
+    startup.ready_ms = round(startup.elapsed_ms(), 1)
+    startup.ready = True
+    startup.done.set()
+    print(f"✅ Ready in {startup.ready_ms} ms {startup.phases_ms}")
+
+
+async def wait_ready(timeout: float | None = None) -> bool:
+    if startup.ready:
+        return True
+    timeout = STARTUP_WAIT_SECONDS if timeout is None else timeout
+    startup.done = startup.done or asyncio.Event()
+    try:
+        await asyncio.wait_for(startup.done.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
@@ -1,9 +1,19 @@
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from dotenv import load_dotenv
 
+from breate_backend.instrumentation import timed_pool, watch_pool, watch_statements
+from breate_backend.slow_queries import watch_slow_queries
+
 # -------------------------------------------------
 # Load environment variables (.env at project root)
 # -------------------------------------------------
@@ -23,14 +33,60 @@ if not DATABASE_URL:
 # -------------------------------------------------
 # Engine (Neon Postgres)
 # -------------------------------------------------
-engine = create_engine(
-    DATABASE_URL,
+# Per worker and per engine; sync and async pools are sized alike.
+# Size them from the checkout-wait histogram on /health/db/pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+
+# Connections this instance may hold on one database, over all workers
+# and both pools of each. Neon's direct limit depends on the compute size
+# (112 at 0.25 CU, a few reserved); its -pooler endpoint allows far more.
+# Divide it further if several instances share the database.
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 100))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))  # workers, as gunicorn reads it
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", -1))  # seconds, -1 = never
+DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", 2))  # opened per engine at startup
+
+
+def pool_limits(size: int, overflow: int, budget: int, workers: int, engines: int = 2) -> tuple[int, int]:
+    """
+    Shrinks (pool_size, max_overflow) so `engines` pools in each of
+    `workers` processes stay within `budget` connections.
+    """
+    cap = max(budget // (workers * engines), 1)
+    size = min(size, cap)
+    return size, min(overflow, cap - size)
+
+
+DB_POOL_SIZE, DB_MAX_OVERFLOW = pool_limits(DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_MAX_CONNECTIONS, WEB_CONCURRENCY)
+
+ENGINE_OPTIONS = dict(
     pool_pre_ping=True,     # handles dropped connections
-    pool_size=5,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
     echo=False
 )
 
+
+def instrument(name: str, engine):
+    """
+    Pool metrics, per-request SQL timing and the slow-query log for `engine`.
+    """
+    watch_pool(name, engine, DB_POOL_RECYCLE)
+    watch_statements(engine)
+    watch_slow_queries(name, engine)
+
+
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=timed_pool("primary", QueuePool),
+    **ENGINE_OPTIONS
+)
+instrument("primary", engine)
+
 # -------------------------------------------------
 # Session
 # -------------------------------------------------
@@ -40,6 +96,149 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# -------------------------------------------------
+# Async engine (asyncpg / aiosqlite)
+# -------------------------------------------------
+# Same database, separate pool. Hot read routes are `async def` and use
+# this engine, so a worker waiting on Neon latency holds requests on the
+# event loop instead of occupying AnyIO threads.
+def async_url(url: str):
+    """
+    Maps a sync DATABASE_URL onto its async driver.
+
+    asyncpg does not understand libpq's sslmode/channel_binding query
+    args, so sslmode is passed through as its `ssl` connect arg instead.
+    Returns (url, connect_args).
+    """
+    url = make_url(url)
+    connect_args = {}
+
+    if url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url, connect_args
+
+
+_async_url, _async_connect_args = async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    _async_url,
+    connect_args=_async_connect_args,
+    poolclass=timed_pool("primary_async", AsyncAdaptedQueuePool),
+    **ENGINE_OPTIONS
+)
+instrument("primary_async", async_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# -------------------------------------------------
+# Read replica (optional)
+# -------------------------------------------------
+# Public GET routes take their session from get_read_db/get_async_read_db.
+# Without DATABASE_READ_URL those are the primary pools; with it, a
+# separate pair of pools on the replica. A client that has just written
+# carries a short-lived cookie (set in main.py) and is read from the
+# primary until it expires, so it sees its own write despite replica lag.
+#
+# The frontend is served from another site, so the cookie is
+# SameSite=None; Secure and the frontend must send credentials with its
+# API calls (fetch `credentials: "include"`, axios `withCredentials`),
+# with CORS_ORIGINS listing its origin. Set READ_STICKY_SAMESITE=lax when
+# frontend and API share a site.
+#
+# Locally, point DATABASE_READ_URL at a second database (e.g. another
+# SQLite file holding a copy of the schema) to exercise the routing.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+READ_STICKY_SECONDS = int(os.getenv("READ_STICKY_SECONDS", 5))
+READ_STICKY_COOKIE = "breate_primary_until"
+READ_STICKY_SAMESITE = os.getenv("READ_STICKY_SAMESITE", "none").lower()  # none | lax | strict
+
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL,
+        poolclass=timed_pool("replica", QueuePool),
+        **ENGINE_OPTIONS
+    )
+    instrument("replica", read_engine)
+
+    _read_url, _read_connect_args = async_url(DATABASE_READ_URL)
+    async_read_engine = create_async_engine(
+        _read_url,
+        connect_args=_read_connect_args,
+        poolclass=timed_pool("replica_async", AsyncAdaptedQueuePool),
+        **ENGINE_OPTIONS
+    )
+    instrument("replica_async", async_read_engine)
+else:
+    read_engine, async_read_engine = engine, async_engine
+
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# -------------------------------------------------
+# Pool pre-warming
+# -------------------------------------------------
+# A cold worker otherwise pays the TCP + TLS handshake (and, on Neon, the
+# compute wake-up) inside its first requests. Connections are opened
+# concurrently and handed straight back, so they sit idle in the pool.
+def prewarm(engine, count: int = DB_POOL_PREWARM):
+    count = min(count, DB_POOL_SIZE)
+    if count <= 0:
+        return
+    with ThreadPoolExecutor(max_workers=count, thread_name_prefix="prewarm") as executor:
+        futures = [executor.submit(engine.connect) for _ in range(count)]
+    errors = [f.exception() for f in futures if f.exception() is not None]
+    for future in futures:
+        if future.exception() is None:
+            future.result().close()
+    if errors:
+        raise errors[0]
+
+
+async def prewarm_async(engine, count: int = DB_POOL_PREWARM):
+    count = min(count, DB_POOL_SIZE)
+    if count <= 0:
+        return
+    results = await asyncio.gather(*[engine.connect() for _ in range(count)], return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    for conn in results:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    if errors:
+        raise errors[0]
+
+
+async def prewarm_all(count: int = DB_POOL_PREWARM):
+    """
+    Pre-warms every engine of this worker (primary and, if set, replica).
+    """
+    sync_engines = [engine] if read_engine is engine else [engine, read_engine]
+    async_engines = [async_engine] if async_read_engine is async_engine else [async_engine, async_read_engine]
+    await asyncio.gather(
+        *[asyncio.to_thread(prewarm, e, count) for e in sync_engines],
+        *[prewarm_async(e, count) for e in async_engines],
+    )
+
 # -------------------------------------------------
 # Base
 # -------------------------------------------------
@@ -55,3 +254,32 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def wants_primary(request: Request) -> bool:
+    """
+    True while the client's read-your-writes window is open.
+    """
+    until = request.cookies.get(READ_STICKY_COOKIE)
+    try:
+        return until is not None and float(until) > time.time()
+    except ValueError:
+        return False
+
+
+def get_read_db(request: Request):
+    db = (SessionLocal if wants_primary(request) else ReadSessionLocal)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    factory = AsyncSessionLocal if wants_primary(request) else AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
@@ -1,22 +1,31 @@
+import os
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from breate_backend.database import get_db
-from breate_backend import models
-from breate_backend.auth import SECRET_KEY, ALGORITHM, verify_access_token
+from breate_backend.auth import CurrentUser, resolve_user, verify_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
 
+# Comma-separated emails allowed on /admin/* endpoints
+ADMIN_EMAILS = {
+    email.strip().lower()
+    for email in os.getenv("ADMIN_EMAILS", "").split(",")
+    if email.strip()
+}
+
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-) -> models.User:
+) -> CurrentUser:
     """
     Extracts and validates the current user from JWT token.
-    Token contains email in 'sub' field (from /users/login endpoint).
+    Token contains email in 'sub' and the user id in 'uid' (from /users/login
+    endpoint); the identity is served from the auth identity cache.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -37,9 +46,22 @@ def get_current_user(
     except (JWTError, HTTPException):
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = resolve_user(payload, db)
 
     if user is None:
         raise credentials_exception
 
     return user
+
+
+def require_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """
+    Lets through only users listed in ADMIN_EMAILS.
+    """
+    if current_user.email.lower() not in ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return current_user
@@ -0,0 +1,327 @@
+import bisect
+import logging
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session, raiseload
+
+# =====================================================
+# Per-request stats
+# =====================================================
+# The request middleware in main.py binds a fresh RequestStats for every
+# request. Sync routes run in AnyIO threads that copy the request context,
+# and async routes share it, so DB hooks anywhere below can add to the
+# object without it being passed around.
+
+
+# Fraction of requests whose SQL is timed (pool waits are always recorded)
+SQL_TIMING_SAMPLE_RATE = float(os.getenv("SQL_TIMING_SAMPLE_RATE", 1.0))
+
+# N+1 guards for dev/CI (see "Query budgets" below)
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "off").lower()  # off | warn | raise
+ORM_LAZY_RAISE = os.getenv("ORM_LAZY_RAISE", "0").lower() in ("1", "true", "yes")
+
+budget_logger = logging.getLogger("breate.query_budget")
+
+
+@dataclass(slots=True)
+class RequestStats:
+    pool_wait_ms: float = 0.0
+    pool_checkouts: int = 0
+    sampled: bool = False
+    queries: int = 0
+    db_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_sql: str | None = None
+    query_budget: int | None = None
+    last_lazy_load: str | None = None
+
+    @classmethod
+    def start(cls) -> "RequestStats":
+        # Budgets need every statement counted
+        sampled = QUERY_BUDGET_MODE != "off" or random.random() < SQL_TIMING_SAMPLE_RATE
+        return cls(sampled=sampled)
+
+    def server_timing(self, total_ms: float) -> str:
+        """
+        Server-Timing header value; DB entries only on sampled requests.
+        """
+        entries = []
+        if self.sampled:
+            entries.append(f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"')
+            entries.append(f"db-slowest;dur={self.slowest_ms:.1f}")
+        entries.append(f"pool;dur={self.pool_wait_ms:.1f}")
+        entries.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(entries)
+
+
+REQUEST_STATS: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+# -------------------------------------------------
+# Histogram
+# -------------------------------------------------
+class Histogram:
+    """
+    Fixed-bucket histogram; bucket counts are cumulative on snapshot.
+    """
+
+    def __init__(self, buckets: list[float]):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total, largest = self._sum, self._max
+
+        cumulative, running = {}, 0
+        for bound, count in zip([*self.buckets, "+Inf"], counts):
+            running += count
+            cumulative[str(bound)] = running
+
+        return {
+            "count": running,
+            "sum": round(total, 3),
+            "max": round(largest, 3),
+            "buckets": cumulative,
+        }
+
+
+# =====================================================
+# Connection-pool instrumentation
+# =====================================================
+# Checkout wait is timed around the pool's _do_get(), the one place a
+# caller blocks until a connection is free (or a new one is opened). The
+# timing subclass is built per engine so that pool.recreate(), which
+# instantiates self.__class__, keeps reporting into the same metrics.
+# Open/close/invalidate counts come from pool events on the engine;
+# failed pre-pings (a connection that died while idle in the pool) are
+# told apart through handle_error.
+
+CHECKOUT_WAIT_BUCKETS_MS = [0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkout_wait_ms = Histogram(CHECKOUT_WAIT_BUCKETS_MS)
+        self.opened = 0
+        self.closed = 0
+        self.recycled = 0
+        self.invalidated = 0
+        self.pre_ping_failed = 0
+        self._lock = threading.Lock()
+
+    def incr(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+
+POOL_METRICS: dict[str, PoolMetrics] = {}
+ENGINES: dict[str, object] = {}
+
+
+def timed_pool(name: str, base):
+    """
+    Subclass of pool class `base` that records checkout waits as `name`.
+    """
+    metrics = POOL_METRICS.setdefault(name, PoolMetrics())
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return base._do_get(self)
+        finally:
+            waited_ms = (time.perf_counter() - start) * 1000
+            metrics.checkout_wait_ms.observe(waited_ms)
+            stats = REQUEST_STATS.get()
+            if stats is not None:
+                stats.pool_wait_ms += waited_ms
+                stats.pool_checkouts += 1
+
+    # Same module as `base`, so SQLAlchemy's per-instance logger stays
+    # under sqlalchemy.pool.* and keeps its log level
+    return type(
+        f"Timed{base.__name__}",
+        (base,),
+        {"_do_get": _do_get, "__module__": base.__module__},
+    )
+
+
+def watch_pool(name: str, engine, recycle_seconds: int = -1):
+    """
+    Counts connection lifecycle events of `engine` and lists it on
+    /health/db/pool. A close of a connection older than the recycle age
+    is counted as a recycle.
+    """
+    metrics = POOL_METRICS.setdefault(name, PoolMetrics())
+    ENGINES[name] = engine
+    target = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(target, "connect")
+    def on_connect(dbapi_connection, record):
+        metrics.incr("opened")
+
+    @event.listens_for(target, "close")
+    def on_close(dbapi_connection, record):
+        metrics.incr("closed")
+        if recycle_seconds > 0 and time.time() - record.starttime >= recycle_seconds:
+            metrics.incr("recycled")
+
+    # Fired for failed pre-pings and connections dropped mid-use
+    @event.listens_for(target, "invalidate")
+    def on_invalidate(dbapi_connection, record, exception):
+        metrics.incr("invalidated")
+
+    @event.listens_for(target, "handle_error")
+    def on_error(exception_context):
+        if exception_context.is_pre_ping:
+            metrics.incr("pre_ping_failed")
+
+
+# =====================================================
+# Statement timing
+# =====================================================
+# Cursor-level hooks that add to the current request's stats. Outside a
+# request, or on an unsampled one, they return after a contextvar lookup.
+# Start times go on a per-connection stack so nested executes (e.g. a
+# flush inside a query) pair up correctly.
+
+
+def watch_statements(engine):
+    target = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(target, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = REQUEST_STATS.get()
+        if stats is None or not stats.sampled:
+            return
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = REQUEST_STATS.get()
+        if stats is None or not stats.sampled:
+            return
+        started = conn.info.get("query_start")
+        if not started:
+            return
+
+        elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+        stats.queries += 1
+        stats.db_ms += elapsed_ms
+        if elapsed_ms > stats.slowest_ms:
+            stats.slowest_ms = elapsed_ms
+            stats.slowest_sql = statement
+
+        if stats.query_budget is not None and stats.queries > stats.query_budget:
+            over_budget(stats, statement)
+
+    # A failed statement never reaches after_cursor_execute
+    @event.listens_for(target, "handle_error")
+    def on_error(exception_context):
+        conn = exception_context.connection
+        started = conn.info.get("query_start") if conn is not None else None
+        if started:
+            started.pop()
+
+
+# =====================================================
+# Query budgets (N+1 guard)
+# =====================================================
+# Routes declare how many statements a request may issue with
+# `dependencies=[Depends(query_budget(n))]`; the count includes auth
+# lookups. With QUERY_BUDGET_MODE=warn the first statement over budget
+# is logged, with raise it fails the request (and any test driving it).
+# Either way the message names the last lazy-loaded relationship, which
+# is almost always the culprit.
+#
+# ORM_LAZY_RAISE=1 goes further for CI: every top-level ORM SELECT gets
+# raiseload("*"), so touching an attribute that was not eager-loaded
+# raises at once, whatever the budget says. Explicit joinedload/
+# selectinload options still win over the wildcard.
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+def query_budget(limit: int):
+    """
+    Route dependency declaring the most SQL statements a request may run.
+    """
+    async def declare_budget():
+        stats = REQUEST_STATS.get()
+        if stats is not None and QUERY_BUDGET_MODE != "off":
+            stats.query_budget = limit
+
+    return declare_budget
+
+
+def over_budget(stats: RequestStats, statement: str):
+    message = (
+        f"Query budget of {stats.query_budget} exceeded "
+        f"(statement #{stats.queries}: {' '.join(statement.split())[:120]})"
+    )
+    if stats.last_lazy_load:
+        message += f"; last lazy load: {stats.last_lazy_load}"
+
+    if QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded(message)
+
+    # warn: once per request
+    if stats.queries == stats.query_budget + 1:
+        budget_logger.warning(message)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_orm_execute(orm_execute_state):
+    if not orm_execute_state.is_select:
+        return
+    if orm_execute_state.lazy_loaded_from is not None:
+        stats = REQUEST_STATS.get()
+        if stats is not None:
+            stats.last_lazy_load = str(orm_execute_state.loader_strategy_path[-1])
+    elif ORM_LAZY_RAISE and not orm_execute_state.is_relationship_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+def pool_status() -> dict:
+    """
+    Live pool occupancy plus lifecycle counters for every watched engine.
+    """
+    out = {}
+    for name, engine in ENGINES.items():
+        pool = engine.pool
+        metrics = POOL_METRICS[name]
+        out[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow_in_use": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+            "opened": metrics.opened,
+            "closed": metrics.closed,
+            "recycled": metrics.recycled,
+            "invalidated": metrics.invalidated,
+            "pre_ping_failed": metrics.pre_ping_failed,
+            "checkout_wait_ms": metrics.checkout_wait_ms.snapshot(),
+        }
+    return out
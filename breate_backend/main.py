@@ -1,14 +1,29 @@
+import time
+
+BOOT_STARTED = time.perf_counter()
+
+import asyncio
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 import logging
 
-from breate_backend.database import engine, get_db, SessionLocal
-from breate_backend import models
+from breate_backend.database import (
+    DATABASE_READ_URL,
+    READ_STICKY_COOKIE,
+    READ_STICKY_SAMESITE,
+    READ_STICKY_SECONDS,
+    async_engine,
+    async_read_engine,
+    get_db,
+)
+from breate_backend import auth, bootstrap, metrics, reference, request_log
+from breate_backend.instrumentation import REQUEST_STATS, RequestStats, pool_status
 
 # -------------------------------------------------
 # Import routers
@@ -23,8 +38,31 @@ from breate_backend.routers import (
     projects,
     coalitions,
     collabcircle,
+    admin,
 )
 
+bootstrap.startup.began = BOOT_STARTED
+
+# -------------------------------------------------
+# Lifespan
+# -------------------------------------------------
+# Schema, seeding, pool pre-warming and cache warming run in the
+# background (see bootstrap.py) so the worker answers /health/ready at
+# once and reports 503 until they are done.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    request_log.start()
+    warm_up = asyncio.create_task(bootstrap.warm_up())
+    try:
+        yield
+    finally:
+        bootstrap.startup.ready = False  # drain: fail readiness first
+        warm_up.cancel()
+        request_log.stop()
+        await async_engine.dispose()
+        if async_read_engine is not async_engine:
+            await async_read_engine.dispose()
+
 # -------------------------------------------------
 # App
 # -------------------------------------------------
@@ -32,31 +70,74 @@ app = FastAPI(
     title="Breate API",
     version="1.0.0",
     description="Backend API for the Breate Web App (Phase 1 MVP)",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Request logging middleware
+# Hold requests that arrive before warm-up has finished
+@app.middleware("http")
+async def wait_for_warm_up(request: Request, call_next):
+    if bootstrap.startup.ready or request.url.path.startswith(("/health", "/metrics")):
+        return await call_next(request)
+    if not await bootstrap.wait_ready():
+        return ORJSONResponse(
+            {"detail": "Service is starting, retry shortly"},
+            status_code=503,
+            headers={"Retry-After": "5"},
+        )
+    return await call_next(request)
+
+# Request logging middleware (JSON lines, see request_log.py)
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    origin = request.headers.get('origin', 'N/A')
-    method = request.method
-    path = request.url.path
-    query = str(request.url.query) if request.url.query else ""
-    full_path = f"{path}?{query}" if query else path
-    
-    logger.info(f"📥 {method} {full_path}")
-    logger.info(f"   Origin: {origin}")
-    logger.info(f"   Headers: {dict(request.headers)}")
-    
+    stats = RequestStats.start()
+    token = REQUEST_STATS.set(stats)
+    started = time.perf_counter()
+    status_code, response = 500, None
+    metrics.IN_FLIGHT.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        REQUEST_STATS.reset(token)
+        metrics.IN_FLIGHT.dec()
+        total_ms = (time.perf_counter() - started) * 1000
+        route = request_log.route_template(request)
+        metrics.observe_request(request.method, route, status_code, total_ms / 1000, stats)
+        if bootstrap.startup.first_response is None and not route.startswith(("/health", "/metrics")):
+            bootstrap.startup.note_response(route, total_ms)
+        request_log.log_request(request, status_code, total_ms, stats, response)
+
+    response.headers["Server-Timing"] = stats.server_timing(total_ms)
+    return response
+
+# -------------------------------------------------
+# Read-your-writes (only with a read replica configured)
+# -------------------------------------------------
+# After a successful write, read this client from the primary for a few
+# seconds; see get_read_db in database.py.
+@app.middleware("http")
+async def stick_to_primary_after_write(request: Request, call_next):
     response = await call_next(request)
-    
-    logger.info(f"📤 {method} {full_path} - Status: {response.status_code}")
-    if response.status_code >= 400:
-        logger.error(f"   ❌ Error response: {response.status_code}")
-    
+
+    if (
+        DATABASE_READ_URL
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            key=READ_STICKY_COOKIE,
+            value=str(time.time() + READ_STICKY_SECONDS),
+            max_age=READ_STICKY_SECONDS,
+            httponly=True,
+            samesite=READ_STICKY_SAMESITE,
+            secure=READ_STICKY_SAMESITE == "none",  # browsers drop SameSite=None without it
+        )
+
     return response
 
 # -------------------------------------------------
@@ -91,13 +172,6 @@ app.add_middleware(
     expose_headers=["Content-Type", "Authorization"],
 )
 
-# -------------------------------------------------
-# Database bootstrap (Phase 1 only)
-# -------------------------------------------------
-print("🛠️ Initializing database schema...")
-models.Base.metadata.create_all(bind=engine)
-print("✅ Database schema ready.")
-
 # -------------------------------------------------
 # Routers
 # -------------------------------------------------
@@ -115,6 +189,7 @@ app.include_router(discover.router, prefix=API_PREFIX)
 app.include_router(projects.router, prefix=API_PREFIX)
 app.include_router(coalitions.router, prefix=API_PREFIX)
 app.include_router(collabcircle.router, prefix=API_PREFIX)
+app.include_router(admin.router, prefix=API_PREFIX)
 
 # -------------------------------------------------
 # Root
@@ -139,6 +214,43 @@ def health_check():
         }
     }
 
+@app.get("/health/ready", tags=["Health"])
+def readiness():
+    """
+    503 until startup warm-up has finished (and again while shutting
+    down); the body breaks startup time down by phase.
+    """
+    return ORJSONResponse(
+        bootstrap.startup.report(),
+        status_code=200 if bootstrap.startup.ready else 503,
+    )
+
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """
+    Hit/miss counters of this worker's auth caches.
+    """
+    return {
+        "access_tokens": auth.token_cache.stats(),
+        "identities": auth.identity_cache.stats(),
+        "reference": reference.reference_cache.stats(),
+    }
+
+@app.get("/health/logs", tags=["Health"])
+def request_log_stats():
+    """
+    Request-log queue depth and lines dropped because it was full.
+    """
+    return request_log.stats()
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """
+    Prometheus text format; see metrics.py for multi-worker setup.
+    """
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
 @app.get("/health/db", tags=["Health"])
 def check_db_connection(db: Session = Depends(get_db)):
     try:
@@ -153,60 +265,10 @@ def check_db_connection(db: Session = Depends(get_db)):
             "detail": str(e)
         }
 
-# -------------------------------------------------
-# Seed core reference data (idempotent)
-# -------------------------------------------------
-@app.on_event("startup")
-def seed_reference_data():
-    db = SessionLocal()
-    try:
-        # Archetypes
-        archetypes = [
-            ("Creator", "Visionary builders who bring ideas to life."),
-            ("Creative", "Expressive individuals skilled in storytelling and design."),
-            ("Innovator", "Thinkers who challenge norms and create new approaches."),
-            ("Systems Thinker", "Analytical minds who design scalable systems."),
-        ]
-
-        for name, description in archetypes:
-            if not db.query(models.Archetype).filter_by(name=name).first():
-                db.add(models.Archetype(name=name, description=description))
-
-        # Tiers
-        tiers = [
-            ("Base", 1, "Entry-level creators starting out."),
-            ("Standard", 2, "Intermediate users gaining experience."),
-            ("Professional", 3, "Experts with consistent contributions."),
-        ]
-
-        for name, level, description in tiers:
-            if not db.query(models.Tier).filter_by(name=name).first():
-                db.add(models.Tier(name=name, level=level, description=description))
-
-        # Coalitions
-        coalitions = [
-            ("University of Ghana", "Academic creative ecosystem", "Education", "Ghana"),
-            ("Tech for Good", "Builders using tech for social impact", "Innovation", "Africa"),
-        ]
-
-        for name, description, focus, location in coalitions:
-            if not db.query(models.Coalition).filter_by(name=name).first():
-                db.add(
-                    models.Coalition(
-                        name=name,
-                        description=description,
-                        focus=focus,
-                        location=location,
-                    )
-                )
-
-        db.commit()
-        print("✅ Reference data seeded")
-
-    except Exception as e:
-        print("❌ Error seeding reference data:", str(e))
-    finally:
-        db.close()
-
-
-
+@app.get("/health/db/pool", tags=["Health"])
+def db_pool_stats():
+    """
+    Pool occupancy, connection lifecycle counts and the checkout-wait
+    histogram (ms) for each engine in this worker.
+    """
+    return pool_status()
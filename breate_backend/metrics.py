@@ -0,0 +1,132 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+from breate_backend.instrumentation import ENGINES
+
+# =====================================================
+# Prometheus metrics (served on /metrics)
+# =====================================================
+# Single process: metrics live in the default registry.
+#
+# Several uvicorn/gunicorn workers: set PROMETHEUS_MULTIPROC_DIR to an
+# empty, writable directory in the environment of the process manager
+# (it must be set before the workers import prometheus_client, so not in
+# .env) and wipe it on every deploy. Each worker then writes its values
+# to mmap files there and whichever worker serves /metrics merges them,
+# so a scrape sees the whole instance. Under gunicorn, child_exit in
+# gunicorn.conf.py drops the gauges of restarted workers. render.yaml
+# does all three for production.
+
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1, 2)
+
+
+# -------------------------------------------------
+# HTTP
+# -------------------------------------------------
+REQUESTS = Counter(
+    "breate_http_requests_total",
+    "Requests by route template and status class",
+    ["method", "route", "status"],
+)
+LATENCY = Histogram(
+    "breate_http_request_duration_seconds",
+    "Request latency by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+IN_FLIGHT = Gauge(
+    "breate_http_requests_in_flight",
+    "Requests currently being served",
+    multiprocess_mode="livesum",
+)
+
+# -------------------------------------------------
+# Database
+# -------------------------------------------------
+POOL_CHECKED_OUT = Gauge(
+    "breate_db_pool_checked_out",
+    "Connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "breate_db_pool_connections",
+    "Connections currently open (idle + checked out)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_WAIT = Histogram(
+    "breate_db_pool_wait_seconds",
+    "Time a request spent waiting for pooled connections",
+    buckets=LATENCY_BUCKETS,
+)
+
+# -------------------------------------------------
+# Password hashing
+# -------------------------------------------------
+HASH_SECONDS = Histogram(
+    "breate_password_hash_seconds",
+    "Argon2 work per call (hash, verify, verify_and_update)",
+    ["op"],
+    buckets=HASH_BUCKETS,
+)
+HASH_QUEUE_WAIT = Histogram(
+    "breate_password_queue_wait_seconds",
+    "Time a hashing job waited for a free hashing thread",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def status_class(status: int) -> str:
+    return f"{status // 100}xx"
+
+
+def observe_request(method: str, route: str, status: int, seconds: float, stats):
+    REQUESTS.labels(method, route, status_class(status)).inc()
+    LATENCY.labels(method, route).observe(seconds)
+    POOL_WAIT.observe(stats.pool_wait_ms / 1000)
+    observe_pools()
+
+
+def observe_pools():
+    """
+    Copies this worker's pool occupancy into the gauges. Done at the end
+    of each request, so every worker's share stays current in
+    multiprocess mode, whichever worker serves the scrape.
+    """
+    for name, engine in ENGINES.items():
+        pool = engine.pool
+        POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+        POOL_SIZE.labels(name).set(pool.checkedin() + pool.checkedout())
+
+
+def observe_hash(op: str, queue_wait: float, seconds: float):
+    HASH_QUEUE_WAIT.observe(queue_wait)
+    HASH_SECONDS.labels(op).observe(seconds)
+
+
+def render() -> tuple[bytes, str]:
+    """
+    Text exposition of every metric, merged across workers when
+    PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    observe_pools()
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
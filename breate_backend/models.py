@@ -1,3 +1,5 @@
+import enum
+
 from sqlalchemy import (
     Column,
     Integer,
@@ -6,6 +8,10 @@ from sqlalchemy import (
     Table,
     Text,
     DateTime,
+    Enum,
+    Index,
+    DDL,
+    event,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,6 +19,30 @@ from sqlalchemy.sql import func
 from breate_backend.database import Base
 
 
+# =====================================================
+# EXTENSIONS (Postgres only)
+# =====================================================
+
+# pg_trgm backs the fuzzy search indexes below (see search.py)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """
+    GIN trigram index for ILIKE '%q%' / similarity search; skipped on SQLite.
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
 # =====================================================
 # ASSOCIATION TABLES
 # =====================================================
@@ -20,8 +50,28 @@ from breate_backend.database import Base
 coalition_members = Table(
     "coalition_members",
     Base.metadata,
-    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE")),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True),
     Column("coalition_id", Integer, ForeignKey("coalitions.id", ondelete="CASCADE")),
+    # Covers member counts and member lists per coalition (index-only)
+    Index("ix_coalition_members_coalition_user", "coalition_id", "user_id"),
+)
+
+project_archetypes = Table(
+    "project_archetypes",
+    Base.metadata,
+    Column("project_id", Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("archetype_id", Integer, ForeignKey("archetypes.id", ondelete="CASCADE"), primary_key=True),
+    # Archetype filter on discovery: archetype -> projects
+    Index("ix_project_archetypes_archetype_project", "archetype_id", "project_id"),
+)
+
+project_coalitions = Table(
+    "project_coalitions",
+    Base.metadata,
+    Column("project_id", Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("coalition_id", Integer, ForeignKey("coalitions.id", ondelete="CASCADE"), primary_key=True),
+    # Coalition -> projects (filters, project counts, coalition page)
+    Index("ix_project_coalitions_coalition_project", "coalition_id", "project_id"),
 )
 
 
@@ -60,6 +110,9 @@ class Tier(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        trigram_index("ix_users_username_trgm", "username"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -95,6 +148,11 @@ class User(Base):
 
 class Coalition(Base):
     __tablename__ = "coalitions"
+    __table_args__ = (
+        trigram_index("ix_coalitions_name_trgm", "name"),
+        trigram_index("ix_coalitions_focus_trgm", "focus"),
+        trigram_index("ix_coalitions_location_trgm", "location"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -109,13 +167,29 @@ class Coalition(Base):
         back_populates="coalitions",
     )
 
+    projects = relationship(
+        "Project",
+        secondary=project_coalitions,
+        back_populates="coalitions",
+    )
+
 
 # =====================================================
 # PROJECT
 # =====================================================
 
+class ProjectStatus(str, enum.Enum):
+    open = "open"
+    in_progress = "in_progress"
+    completed = "completed"
+
+
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset index for the feed: ORDER BY created_at DESC, id DESC
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -128,11 +202,23 @@ class Project(Base):
     region = Column(String, nullable=True)
     coalition_tags = Column(Text, nullable=True)
 
+    status = Column(Enum(ProjectStatus), nullable=False, default=ProjectStatus.open)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
 
     poster_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
     poster = relationship("User", back_populates="projects_posted")
 
+    # Normalized form of needed_archetypes (kept in sync on create)
+    archetypes = relationship("Archetype", secondary=project_archetypes)
+
+    # Normalized form of coalition_tags (tags naming a known coalition)
+    coalitions = relationship(
+        "Coalition",
+        secondary=project_coalitions,
+        back_populates="projects",
+    )
+
     participants = relationship(
         "ProjectParticipant",
         back_populates="project",
@@ -140,6 +226,109 @@ class Project(Base):
     )
 
 
+# =====================================================
+# PROJECT STATUS COLUMNS (existing databases)
+# =====================================================
+# status and completed_at were added to projects after the table went
+# live; create_all() never alters an existing table, so they are added
+# here, idempotently, on every create_all().
+
+PROJECT_STATUS_POSTGRES = [
+    """
+    DO $$ BEGIN
+        CREATE TYPE projectstatus AS ENUM ('open', 'in_progress', 'completed');
+    EXCEPTION WHEN duplicate_object THEN NULL;
+    END $$
+    """,
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS status projectstatus NOT NULL DEFAULT 'open'",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS completed_at TIMESTAMP WITH TIME ZONE",
+]
+
+# SQLite has no ADD COLUMN IF NOT EXISTS; each is added only when missing
+PROJECT_STATUS_SQLITE = {
+    "status": "ALTER TABLE projects ADD COLUMN status VARCHAR(11) NOT NULL DEFAULT 'open'",
+    "completed_at": "ALTER TABLE projects ADD COLUMN completed_at DATETIME",
+}
+
+
+@event.listens_for(Base.metadata, "after_create")
+def add_project_status_columns(target, connection, **kw):
+    if connection.dialect.name == "postgresql":
+        for statement in PROJECT_STATUS_POSTGRES:
+            connection.exec_driver_sql(statement)
+
+    elif connection.dialect.name == "sqlite":
+        columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(projects)")}
+        for name, statement in PROJECT_STATUS_SQLITE.items():
+            if name not in columns:
+                connection.exec_driver_sql(statement)
+
+
+# =====================================================
+# PROJECT FULL-TEXT SEARCH
+# =====================================================
+# Kept outside the mapped columns because the storage is dialect specific:
+#   Postgres: stored tsvector column projects.search_vector + GIN index
+#   SQLite:   external-content FTS5 table projects_fts kept in sync by triggers
+# Both are created idempotently on every create_all(), so existing
+# databases pick them up too (see search.py for the query side).
+
+PROJECT_SEARCH_POSTGRES = [
+    """
+    ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(objective, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_projects_search_vector ON projects USING gin (search_vector)",
+]
+
+PROJECT_SEARCH_SQLITE = [
+    """
+    CREATE VIRTUAL TABLE projects_fts USING fts5(
+        title, objective, content='projects', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER projects_fts_ai AFTER INSERT ON projects BEGIN
+        INSERT INTO projects_fts(rowid, title, objective)
+        VALUES (new.id, new.title, new.objective);
+    END
+    """,
+    """
+    CREATE TRIGGER projects_fts_ad AFTER DELETE ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, title, objective)
+        VALUES ('delete', old.id, old.title, old.objective);
+    END
+    """,
+    """
+    CREATE TRIGGER projects_fts_au AFTER UPDATE OF title, objective ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, title, objective)
+        VALUES ('delete', old.id, old.title, old.objective);
+        INSERT INTO projects_fts(rowid, title, objective)
+        VALUES (new.id, new.title, new.objective);
+    END
+    """,
+    "INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')",
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def install_project_search(target, connection, **kw):
+    if connection.dialect.name == "postgresql":
+        for statement in PROJECT_SEARCH_POSTGRES:
+            connection.exec_driver_sql(statement)
+
+    elif connection.dialect.name == "sqlite":
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = 'projects_fts'"
+        ).first()
+        if not exists:
+            for statement in PROJECT_SEARCH_SQLITE:
+                connection.exec_driver_sql(statement)
+
+
 # =====================================================
 # PROJECT PARTICIPANTS
 # =====================================================
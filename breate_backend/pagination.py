@@ -0,0 +1,168 @@
+import base64
+import json
+import os
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, func, tuple_
+
+# -------------------------------------------------
+# Page size limits (server-side cap)
+# -------------------------------------------------
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 20))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+
+
+def clamp_limit(limit: int | None) -> int:
+    """
+    Applies the default page size and the server-side maximum.
+    """
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+# -------------------------------------------------
+# Opaque cursors
+# -------------------------------------------------
+def encode_cursor(values: list) -> str:
+    """
+    Encodes the sort-key values of the last row on a page.
+    """
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    data = json.dumps(raw, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def cursor_value(column, value):
+    """
+    Checks one decoded value against the column's Python type; a value of
+    the wrong type would otherwise reach the database as the bound.
+    """
+    try:
+        expected = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if expected is datetime:
+        if not isinstance(value, str):
+            raise ValueError("cursor value type mismatch")
+        return datetime.fromisoformat(value)
+
+    # JSON has one number type: a float key may come back as an int.
+    # bool is an int subclass, but never a valid key.
+    accepted = (int, float) if expected is float else expected
+    if (isinstance(value, bool) and expected is not bool) or not isinstance(value, accepted):
+        raise ValueError("cursor value type mismatch")
+    return value
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    """
+    Decodes a cursor back into sort-key values typed like `columns`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError("cursor shape mismatch")
+
+        return [cursor_value(column, value) for column, value in zip(columns, raw)]
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+# -------------------------------------------------
+# Keyset pagination
+# -------------------------------------------------
+# SQLite keeps datetimes as text, and not in one format: server_default
+# now() stores "2026-10-17 03:06:06" while bound Python datetimes are
+# written (and compared) as "2026-10-17 03:06:06.000000". Compared as
+# strings, a bound re-includes its own second. There, datetime keys are
+# normalised with strftime() on both sides of the bound and in ORDER BY.
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%f"
+
+
+def sqlite_sort_key(column, value):
+    if isinstance(column.type, DateTime):
+        return func.strftime(SQLITE_DATETIME_FORMAT, value)
+    return value
+
+
+def sort_keys(order_by, values, dialect_name: str | None):
+    """
+    (keys, bounds) to order and compare on; bounds is None without a cursor.
+    """
+    if dialect_name != "sqlite":
+        return list(order_by), values
+    keys = [sqlite_sort_key(column, column) for column in order_by]
+    if values is not None:
+        values = [sqlite_sort_key(column, value) for column, value in zip(order_by, values)]
+    return keys, values
+
+
+def page_query(
+    stmt,
+    order_by,
+    cursor: str | None = None,
+    limit: int | None = None,
+    descending: bool = False,
+    dialect_name: str | None = None,
+):
+    """
+    Adds the keyset bound, ordering and LIMIT (limit + 1) to `stmt`.
+    Returns (stmt, limit).
+    """
+    limit = clamp_limit(limit)
+    values = decode_cursor(cursor, order_by) if cursor else None
+    keys, bounds = sort_keys(order_by, values, dialect_name)
+
+    if bounds is not None:
+        if len(keys) == 1:
+            key, bound = keys[0], bounds[0]
+        else:
+            key, bound = tuple_(*keys), tuple_(*bounds)
+        stmt = stmt.where(key < bound if descending else key > bound)
+
+    stmt = stmt.order_by(
+        *[k.desc() if descending else k.asc() for k in keys]
+    )
+
+    return stmt.limit(limit + 1), limit
+
+
+def finish_page(rows, order_by, limit: int):
+    """
+    Trims the probe row and builds next_cursor. Returns (rows, next_cursor).
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in order_by])
+
+    return rows, next_cursor
+
+
+def paginate(db, stmt, order_by, cursor: str | None = None, limit: int | None = None, descending: bool = False):
+    """
+    Runs one keyset page of the SELECT `stmt` ordered by `order_by`.
+
+    The last column must be unique (normally the primary key) so that the
+    sort key is a total order, and every `order_by` column must be selected
+    by `stmt` under its own key. Returns (rows, next_cursor); next_cursor is
+    None on the last page.
+    """
+    stmt, limit = page_query(stmt, order_by, cursor, limit, descending, db.get_bind().dialect.name)
+    return finish_page(db.execute(stmt).all(), order_by, limit)
+
+
+async def paginate_async(db, stmt, order_by, cursor: str | None = None, limit: int | None = None, descending: bool = False):
+    """
+    paginate() on an AsyncSession.
+    """
+    stmt, limit = page_query(stmt, order_by, cursor, limit, descending, db.get_bind().dialect.name)
+    return finish_page((await db.execute(stmt)).all(), order_by, limit)
@@ -0,0 +1,255 @@
+import argparse
+import asyncio
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from breate_backend import metrics
+
+# -------------------------------------------------
+# Config
+# -------------------------------------------------
+# Argon2 is deliberately slow and memory hungry (~64 MiB per hash), so it
+# gets its own small executor instead of the shared AnyIO threadpool that
+# also serves every sync route and DB session.
+HASH_CONCURRENCY = int(os.getenv("HASH_CONCURRENCY", 2))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", 32))
+HASH_QUEUE_TIMEOUT_SECONDS = float(os.getenv("HASH_QUEUE_TIMEOUT_SECONDS", 2.0))
+
+# Argon2 cost. Defaults are argon2-cffi's; run `calibrate` (below) on the
+# target instance and pin the numbers it prints in the environment.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 3))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 65536))  # KiB
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", 4))
+
+# Calibration target for a single verify, and whether to calibrate on boot
+ARGON2_TARGET_MS = float(os.getenv("ARGON2_TARGET_MS", 200))
+ARGON2_AUTO_CALIBRATE = os.getenv("ARGON2_AUTO_CALIBRATE", "0").lower() in ("1", "true", "yes")
+
+# OWASP floors: 19 MiB needs t >= 2, 46 MiB allows t = 1
+MIN_MEMORY_COST = 19456
+SINGLE_PASS_MEMORY_COST = 47104
+
+
+def build_context(time_cost: int, memory_cost: int, parallelism: int) -> CryptContext:
+    """
+    Argon2 context for the given cost; hashes made under any other
+    parameters report needs_update() and get rehashed on next login.
+    """
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__time_cost=time_cost,
+        argon2__memory_cost=memory_cost,
+        argon2__parallelism=parallelism,
+    )
+
+
+pwd_context = build_context(ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM)
+
+
+class QueueTimeout(Exception):
+    """A hash job waited longer than the queue-wait limit before starting."""
+
+
+# =====================================================
+# Bounded hashing pool
+# =====================================================
+# At most `concurrency` hashes run at once and at most `queue_limit` more
+# wait behind them. Callers beyond that are turned away with 429 straight
+# away; a job that sat in the queue past `queue_timeout` is dropped
+# without hashing and its caller gets 503. Both carry Retry-After so
+# clients back off instead of piling on.
+
+
+class HashingPool:
+    def __init__(self, concurrency: int, queue_limit: int, queue_timeout: float):
+        self.concurrency = concurrency
+        self.queue_limit = queue_limit
+        self.queue_timeout = queue_timeout
+        self.pending = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="argon2",
+        )
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Queues `fn(*args)`; raises 429 if the queue is already full.
+        """
+        with self._lock:
+            if self.pending >= self.concurrency + self.queue_limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many sign-in attempts in progress, retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self.pending += 1
+
+        queued_at = time.monotonic()
+
+        def job():
+            try:
+                started = time.monotonic()
+                if started - queued_at > self.queue_timeout:
+                    raise QueueTimeout()
+                result = fn(*args)
+                metrics.observe_hash(
+                    getattr(fn, "__name__", "call"),
+                    started - queued_at,
+                    time.monotonic() - started,
+                )
+                return result
+            finally:
+                with self._lock:
+                    self.pending -= 1
+
+        return self._executor.submit(job)
+
+    async def run(self, fn, *args):
+        """
+        Runs `fn(*args)` on the pool without blocking the event loop.
+        """
+        try:
+            return await asyncio.wrap_future(self.submit(fn, *args))
+        except QueueTimeout:
+            with self._lock:
+                self.timed_out += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Password service is busy, retry shortly",
+                headers={"Retry-After": "2"},
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "queue_limit": self.queue_limit,
+                "pending": self.pending,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+pool = HashingPool(HASH_CONCURRENCY, HASH_QUEUE_LIMIT, HASH_QUEUE_TIMEOUT_SECONDS)
+
+
+# -------------------------------------------------
+# Hash / verify
+# -------------------------------------------------
+async def hash_password(password: str) -> str:
+    return await pool.run(pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await pool.run(pwd_context.verify, password, hashed)
+
+
+async def verify_and_update(password: str, hashed: str):
+    """
+    Returns (valid, new_hash). new_hash is set when the password is valid
+    but was stored under outdated parameters and should be replaced.
+    """
+    return await pool.run(pwd_context.verify_and_update, password, hashed)
+
+
+# =====================================================
+# Calibration
+# =====================================================
+# Picks the largest memory cost (up to `max_memory_cost`) for which one
+# pass fits the target, then as many passes as the target allows. Verify
+# time is close to linear in time_cost, so one measurement per memory
+# size is enough.
+#
+# Every worker must agree on the parameters, or logins served by
+# different workers keep rehashing each other's output. Prefer running
+# the CLI once per instance type and pinning ARGON2_* in the environment;
+# ARGON2_AUTO_CALIBRATE is for single-worker deployments.
+
+
+def measure_verify_ms(context: CryptContext, samples: int = 5) -> float:
+    hashed = context.hash("calibration-password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration-password", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float = ARGON2_TARGET_MS,
+    max_memory_cost: int = ARGON2_MEMORY_COST,
+    parallelism: int = ARGON2_PARALLELISM,
+    max_time_cost: int = 10,
+) -> dict:
+    memory_cost = max(max_memory_cost, MIN_MEMORY_COST)
+    while True:
+        single_pass_ms = measure_verify_ms(build_context(1, memory_cost, parallelism))
+        if single_pass_ms <= target_ms or memory_cost <= MIN_MEMORY_COST:
+            break
+        memory_cost = max(memory_cost // 2, MIN_MEMORY_COST)
+
+    min_time_cost = 1 if memory_cost >= SINGLE_PASS_MEMORY_COST else 2
+    time_cost = int(target_ms // single_pass_ms) if single_pass_ms else max_time_cost
+    time_cost = max(min_time_cost, min(time_cost, max_time_cost))
+
+    return {
+        "time_cost": time_cost,
+        "memory_cost": memory_cost,
+        "parallelism": parallelism,
+        "verify_ms": round(
+            measure_verify_ms(build_context(time_cost, memory_cost, parallelism)), 1
+        ),
+    }
+
+
+def configure(time_cost: int, memory_cost: int, parallelism: int, **_):
+    """
+    Swaps the process-wide context; existing hashes stay verifiable.
+    """
+    global pwd_context
+    pwd_context = build_context(time_cost, memory_cost, parallelism)
+
+
+def auto_calibrate():
+    params = calibrate()
+    configure(**params)
+    print(
+        "✅ Argon2 calibrated: "
+        f"t={params['time_cost']} m={params['memory_cost']} p={params['parallelism']} "
+        f"({params['verify_ms']} ms/verify)"
+    )
+    return params
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Argon2 cost tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cal = sub.add_parser("calibrate", help="Pick argon2 costs for a target verify latency")
+    cal.add_argument("--target-ms", type=float, default=ARGON2_TARGET_MS)
+    cal.add_argument("--max-memory-cost", type=int, default=ARGON2_MEMORY_COST, help="KiB")
+    cal.add_argument("--parallelism", type=int, default=ARGON2_PARALLELISM)
+    args = parser.parse_args()
+
+    params = calibrate(args.target_ms, args.max_memory_cost, args.parallelism)
+    print(f"# {params['verify_ms']} ms per verify on this machine")
+    print(f"ARGON2_TIME_COST={params['time_cost']}")
+    print(f"ARGON2_MEMORY_COST={params['memory_cost']}")
+    print(f"ARGON2_PARALLELISM={params['parallelism']}")
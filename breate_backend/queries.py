@@ -0,0 +1,368 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from breate_backend import models
+
+# =====================================================
+# Shared read path
+# =====================================================
+# List endpoints select only the columns they return and map the Core
+# rows into slotted dataclasses. No ORM entities are built, so there is
+# no identity map, no attribute instrumentation and no password hashes
+# or long profile text pulled over the wire.
+#
+# from_row() reads attributes by name, so a card can also be built from a
+# single ORM entity (create/update endpoints) with the same mapping.
+
+
+def split_csv(value: str | None) -> list[str]:
+    return value.split(",") if value else []
+
+
+@dataclass(slots=True)
+class UserCard:
+    id: int
+    username: str | None
+    bio: str | None
+    archetype: str | None
+    tier: str | None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(row.id, row.username, row.bio, row.archetype, row.tier)
+
+
+@dataclass(slots=True)
+class ProjectCard:
+    id: int
+    title: str
+    objective: str
+    project_type: str
+    needed_archetypes: list[str]
+    open_roles: str | None
+    timeline: str | None
+    region: str | None
+    coalition_tags: list[str]
+    poster_id: int | None
+    status: str
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            row.id,
+            row.title,
+            row.objective,
+            row.project_type,
+            split_csv(row.needed_archetypes),
+            row.open_roles,
+            row.timeline,
+            row.region,
+            split_csv(row.coalition_tags),
+            row.poster_id,
+            row.status.value,
+            row.created_at,
+        )
+
+
+@dataclass(slots=True)
+class CoalitionCard:
+    id: int
+    name: str
+    description: str | None
+    focus: str | None
+    location: str | None
+    member_count: int
+    project_count: int
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            row.id,
+            row.name,
+            row.description,
+            row.focus,
+            row.location,
+            row.member_count,
+            row.project_count,
+            row.created_at,
+        )
+
+
+@dataclass(slots=True)
+class CollabCard:
+    id: int
+    user_a_username: str
+    user_b_username: str
+    project_name: str | None
+    status: str
+    created_at: datetime
+    verified_at: datetime | None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            row.id,
+            row.user_a_username,
+            row.user_b_username,
+            row.project_name,
+            row.status,
+            row.created_at,
+            row.verified_at,
+        )
+
+
+def fetch(db: Session, stmt, card) -> list:
+    """
+    Executes `stmt` and maps every row with `card.from_row`.
+    """
+    return [card.from_row(row) for row in db.execute(stmt)]
+
+
+async def fetch_async(db, stmt, card) -> list:
+    """
+    fetch() on an AsyncSession.
+    """
+    return [card.from_row(row) for row in await db.execute(stmt)]
+
+
+def user_cards():
+    """
+    SELECT of UserCard columns with archetype and tier names joined in.
+    """
+    return (
+        select(
+            models.User.id,
+            models.User.username,
+            models.User.bio,
+            models.Archetype.name.label("archetype"),
+            models.Tier.name.label("tier"),
+        )
+        .outerjoin(models.Archetype, models.User.archetype_id == models.Archetype.id)
+        .outerjoin(models.Tier, models.User.tier_id == models.Tier.id)
+    )
+
+
+def project_cards():
+    """
+    SELECT of ProjectCard columns.
+    """
+    p = models.Project
+    return select(
+        p.id,
+        p.title,
+        p.objective,
+        p.project_type,
+        p.needed_archetypes,
+        p.open_roles,
+        p.timeline,
+        p.region,
+        p.coalition_tags,
+        p.poster_id,
+        p.status,
+        p.created_at,
+    )
+
+
+def coalition_cards():
+    """
+    SELECT of CoalitionCard columns, counts included.
+    """
+    c = models.Coalition
+    return select(
+        c.id,
+        c.name,
+        c.description,
+        c.focus,
+        c.location,
+        coalition_member_count(),
+        coalition_project_count(),
+        c.created_at,
+    )
+
+
+def collab_cards():
+    """
+    SELECT of CollabCard columns.
+    """
+    link = models.CollabLink
+    return select(
+        link.id,
+        link.user_a_username,
+        link.user_b_username,
+        link.project_name,
+        link.status,
+        link.created_at,
+        link.verified_at,
+    )
+
+
+def coalition_member_count():
+    """
+    Correlated COUNT(*) of a coalition's members.
+
+    Resolved per returned coalition from ix_coalition_members_coalition_user,
+    so listing coalitions never touches the users table.
+    """
+    return (
+        select(func.count())
+        .select_from(models.coalition_members)
+        .where(models.coalition_members.c.coalition_id == models.Coalition.id)
+        .correlate(models.Coalition)
+        .scalar_subquery()
+        .label("member_count")
+    )
+
+
+def coalition_project_count():
+    """
+    Correlated COUNT(*) of projects tagged with a coalition.
+    """
+    return (
+        select(func.count())
+        .select_from(models.project_coalitions)
+        .where(models.project_coalitions.c.coalition_id == models.Coalition.id)
+        .correlate(models.Coalition)
+        .scalar_subquery()
+        .label("project_count")
+    )
+
+
+# =====================================================
+# Project archetype links
+# =====================================================
+
+def split_tags(values) -> list[str]:
+    """
+    Flattens repeated and comma-separated query values into clean names.
+    """
+    names = []
+    for value in values or []:
+        names.extend(part.strip() for part in value.split(",") if part.strip())
+    return names
+
+
+def link_project_archetypes(db: Session, project_id: int, names: list[str]):
+    """
+    Writes project_archetypes rows for the archetypes named in `names`.
+
+    Names that match no archetype are ignored; the raw list is still kept
+    in Project.needed_archetypes.
+    """
+    names = {name.strip().lower() for name in names if name and name.strip()}
+    if not names:
+        return
+
+    db.execute(
+        insert(models.project_archetypes).from_select(
+            ["project_id", "archetype_id"],
+            select(literal(project_id), models.Archetype.id)
+            .where(func.lower(models.Archetype.name).in_(names)),
+        )
+    )
+
+
+def needs_archetypes(names: list[str], match_all: bool = False):
+    """
+    EXISTS predicate on project_archetypes for the given archetype names.
+
+    match_all=False keeps projects needing any of the names, True only those
+    needing every one of them.
+    """
+    links = models.project_archetypes
+
+    def linked(condition):
+        return (
+            select(links.c.project_id)
+            .join(models.Archetype, models.Archetype.id == links.c.archetype_id)
+            .where(links.c.project_id == models.Project.id, condition)
+            .exists()
+        )
+
+    names = [name.lower() for name in names]
+    if match_all:
+        return and_(*[linked(func.lower(models.Archetype.name) == name) for name in names])
+    return linked(func.lower(models.Archetype.name).in_(names))
+
+
+# =====================================================
+# Project coalition links
+# =====================================================
+
+def link_project_coalitions(db: Session, project_id: int, tags: list[str]):
+    """
+    Writes project_coalitions rows for tags naming an existing coalition.
+    """
+    tags = {tag.strip().lower() for tag in tags if tag and tag.strip()}
+    if not tags:
+        return
+
+    db.execute(
+        insert(models.project_coalitions).from_select(
+            ["project_id", "coalition_id"],
+            select(literal(project_id), models.Coalition.id)
+            .where(func.lower(models.Coalition.name).in_(tags)),
+        )
+    )
+
+
+def tagged_with_coalition(name: str | None = None, coalition_id: int | None = None):
+    """
+    EXISTS predicate on project_coalitions by coalition name or id.
+    """
+    links = models.project_coalitions
+    query = select(links.c.project_id).where(links.c.project_id == models.Project.id)
+
+    if coalition_id is not None:
+        query = query.where(links.c.coalition_id == coalition_id)
+    if name is not None:
+        query = (
+            query
+            .join(models.Coalition, models.Coalition.id == links.c.coalition_id)
+            .where(func.lower(models.Coalition.name) == name.strip().lower())
+        )
+
+    return query.exists()
+
+
+# =====================================================
+# Single-statement writes
+# =====================================================
+# Write endpoints run one INSERT/UPDATE ... RETURNING <card columns> and
+# commit, instead of query, mutate, commit, refresh. Checks that used to
+# be a SELECT up front live in the statement's WHERE clause or conflict
+# target; the failure path alone pays for a lookup to pick the error.
+
+
+def insert_or_skip(db: Session, table, conflict_on: list):
+    """
+    INSERT ... ON CONFLICT (conflict_on) DO NOTHING for the bound dialect.
+    With RETURNING, a skipped insert yields no row.
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(table).on_conflict_do_nothing(index_elements=conflict_on)
+
+
+# Driver codes for a unique/primary-key violation: Postgres SQLSTATE
+# (psycopg2 `pgcode`, asyncpg `sqlstate`) and Python's sqlite3 error name
+UNIQUE_VIOLATIONS = {"23505", "SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY"}
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """
+    Tells a duplicate key apart from other integrity errors (foreign key,
+    NOT NULL, CHECK), which need a different message.
+    """
+    orig = error.orig
+    code = (
+        getattr(orig, "pgcode", None)
+        or getattr(orig, "sqlstate", None)
+        or getattr(orig, "sqlite_errorname", None)
+    )
+    return code in UNIQUE_VIOLATIONS
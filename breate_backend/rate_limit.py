@@ -0,0 +1,288 @@
+import importlib
+import ipaddress
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+
+# =====================================================
+# Rate limiting for unauthenticated, expensive endpoints
+# =====================================================
+# Sliding-window counter: each key keeps a count for the current and the
+# previous fixed window, and the estimate weights the previous one by how
+# much of it still overlaps the sliding window. Two integers per key, and
+# any store with "increment with expiry" can hold them, so state can be
+# shared across workers by pointing RATE_LIMIT_BACKEND at another class.
+#
+# Per-IP limits count every attempt, rejected ones included, so a client
+# that keeps hammering stays locked out until it backs off for a full
+# window. Per-account limits (check() + record()) only count failures and
+# never rejected attempts: otherwise anyone who knows an email address
+# could keep its owner locked out.
+
+logger = logging.getLogger("breate.rate_limit")
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1").lower() in ("1", "true", "yes")
+
+# Reverse proxies in front of the app that append to X-Forwarded-For
+# (1 on Render). With 0 the header is ignored and limits key on the TCP
+# peer, which behind a proxy is the proxy: every visitor would share one
+# bucket. Only count proxies you control, or clients can pick their key.
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", 0))
+
+# Limited requests looked at before deciding whether they all came from
+# one private address (see SharedAddressCheck)
+RATE_LIMIT_IP_SAMPLE = int(os.getenv("RATE_LIMIT_IP_SAMPLE", 50))
+
+# "module.path:ClassName" (or "module.path.ClassName"), built with no args
+RATE_LIMIT_BACKEND = os.getenv(
+    "RATE_LIMIT_BACKEND",
+    "breate_backend.rate_limit:MemoryBackend",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Rate:
+    limit: int
+    window: int  # seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "Rate":
+        """
+        "20/60" -> 20 attempts per 60 seconds.
+        """
+        limit, window = value.split("/")
+        return cls(int(limit), int(window))
+
+
+LOGIN_PER_IP = Rate.parse(os.getenv("RATE_LIMIT_LOGIN_IP", "20/60"))
+LOGIN_PER_EMAIL = Rate.parse(os.getenv("RATE_LIMIT_LOGIN_EMAIL", "5/300"))
+SIGNUP_PER_IP = Rate.parse(os.getenv("RATE_LIMIT_SIGNUP_IP", "10/3600"))
+
+
+# -------------------------------------------------
+# Backends
+# -------------------------------------------------
+# A backend needs two operations:
+#   incr(key, ttl) -> int   add 1 and return the new value; the key
+#                           expires `ttl` seconds after it was created
+#   get(key) -> int         current value, 0 if missing or expired
+# Limiter calls run on the threadpool, so a networked backend never
+# blocks the event loop; a backend that never waits on I/O can set
+# `blocking = False` to be called inline. A request still waits for the
+# round trip, so a networked backend should use short timeouts.
+
+
+class MemoryBackend:
+    """
+    Per-process store. Each worker limits on its own, so the effective
+    limit is multiplied by the number of workers.
+    """
+
+    SWEEP_EVERY = 1024
+    blocking = False
+
+    def __init__(self):
+        self._data = {}  # key -> [count, expires_at]
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def incr(self, key: str, ttl: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            self._ops += 1
+            if self._ops % self.SWEEP_EVERY == 0:
+                self._sweep(now)
+
+            entry = self._data.get(key)
+            if entry is None or entry[1] <= now:
+                entry = self._data[key] = [0, now + ttl]
+            entry[0] += 1
+            return entry[0]
+
+    def get(self, key: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] <= now:
+                return 0
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _sweep(self, now: float):
+        expired = [key for key, (_, expires_at) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+
+
+def load_backend(path: str):
+    module_name, _, class_name = path.replace(":", ".").rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+# -------------------------------------------------
+# Limiter
+# -------------------------------------------------
+class RateLimiter:
+    def __init__(self, backend):
+        self.backend = backend
+        self.rejected = 0
+
+    @staticmethod
+    def window(scope: str, identifier: str, rate: Rate) -> tuple[str, int, float]:
+        """
+        (key prefix, current bucket, seconds into it) for `rate` right now.
+        """
+        bucket, offset = divmod(time.time(), rate.window)
+        return f"rl:{scope}:{identifier}", int(bucket), offset
+
+    def reject(self, rate: Rate, offset: float):
+        self.rejected += 1
+        raise HTTPException(
+            status_code=429,
+            detail="Too many attempts, try again later",
+            headers={"Retry-After": str(max(1, math.ceil(rate.window - offset)))},
+        )
+
+    def hit(self, scope: str, identifier: str, rate: Rate):
+        """
+        Records an attempt; raises 429 with Retry-After when over `rate`.
+        """
+        key, bucket, offset = self.window(scope, identifier, rate)
+        previous = self.backend.get(f"{key}:{bucket - 1}")
+        current = self.backend.incr(f"{key}:{bucket}", ttl=rate.window * 2)
+        if previous * (1 - offset / rate.window) + current > rate.limit:
+            self.reject(rate, offset)
+
+    def check(self, scope: str, identifier: str, rate: Rate):
+        """
+        Raises 429 when `rate` is already used up; records nothing.
+        """
+        key, bucket, offset = self.window(scope, identifier, rate)
+        previous = self.backend.get(f"{key}:{bucket - 1}")
+        current = self.backend.get(f"{key}:{bucket}")
+        if previous * (1 - offset / rate.window) + current >= rate.limit:
+            self.reject(rate, offset)
+
+    def record(self, scope: str, identifier: str, rate: Rate):
+        """
+        Counts one attempt against `rate` without checking it.
+        """
+        key, bucket, _ = self.window(scope, identifier, rate)
+        self.backend.incr(f"{key}:{bucket}", ttl=rate.window * 2)
+
+
+limiter = RateLimiter(load_backend(RATE_LIMIT_BACKEND))
+
+
+# -------------------------------------------------
+# Client address
+# -------------------------------------------------
+def client_ip(request: Request) -> str:
+    """
+    The address RATE_LIMIT_TRUSTED_PROXIES hops back in X-Forwarded-For,
+    i.e. the one our outermost proxy saw; the TCP peer otherwise.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not RATE_LIMIT_TRUSTED_PROXIES:
+        return peer
+
+    forwarded = ",".join(request.headers.getlist("x-forwarded-for"))
+    addresses = [address.strip() for address in forwarded.split(",") if address.strip()]
+    if len(addresses) < RATE_LIMIT_TRUSTED_PROXIES:
+        return peer
+    return addresses[-RATE_LIMIT_TRUSTED_PROXIES]
+
+
+def is_private(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    # Loopback is a local run, not a proxy
+    return ip.is_private and not ip.is_loopback
+
+
+class SharedAddressCheck:
+    """
+    Warns once, after the first `sample` limited requests since startup,
+    if they all came from the same private address: the signature of a
+    proxy in front of the app with RATE_LIMIT_TRUSTED_PROXIES unset.
+    """
+
+    def __init__(self, sample: int):
+        self.sample = sample
+        self.seen = 0
+        self.address = None
+        self.done = sample <= 0
+        self._lock = threading.Lock()
+
+    def observe(self, address: str):
+        if self.done:
+            return
+        with self._lock:
+            if self.done:
+                return
+            if self.address is None:
+                self.address = address
+            elif address != self.address or not is_private(address):
+                self.done = True
+                return
+
+            self.seen += 1
+            if self.seen < self.sample:
+                return
+            self.done = True
+
+        if is_private(self.address):
+            logger.warning(
+                "⚠️  The first %d rate-limited requests all came from %s, so every "
+                "client shares one limit. Behind a proxy, set RATE_LIMIT_TRUSTED_PROXIES.",
+                self.seen,
+                self.address,
+            )
+
+
+shared_address_check = SharedAddressCheck(RATE_LIMIT_IP_SAMPLE)
+
+
+async def call_backend(fn, *args):
+    """
+    Runs a limiter call inline for in-process backends, on the threadpool
+    for any that may block.
+    """
+    if getattr(limiter.backend, "blocking", True):
+        return await run_in_threadpool(fn, *args)
+    return fn(*args)
+
+
+async def limit(request: Request, scope: str, rate: Rate, identifier: str | None = None):
+    """
+    Throttles `scope` per client IP, or per `identifier` when given.
+    """
+    if not RATE_LIMIT_ENABLED:
+        return
+    address = client_ip(request)
+    shared_address_check.observe(address)
+    await call_backend(limiter.hit, scope, identifier or address, rate)
+
+
+async def check(scope: str, identifier: str, rate: Rate):
+    """
+    Refuses `identifier` once its recorded failures use up `rate`.
+    """
+    if RATE_LIMIT_ENABLED:
+        await call_backend(limiter.check, scope, identifier, rate)
+
+
+async def record_failure(scope: str, identifier: str, rate: Rate):
+    if RATE_LIMIT_ENABLED:
+        await call_backend(limiter.record, scope, identifier, rate)
@@ -0,0 +1,43 @@
+import os
+
+from sqlalchemy.orm import Session
+
+from breate_backend import models, schemas
+from breate_backend.cache import TTLCache
+
+# =====================================================
+# Reference data cache
+# =====================================================
+# Archetypes and tiers only change through seeding, yet every signup
+# form and Discover filter asks for them. Each worker keeps the rendered
+# lists for REFERENCE_CACHE_SECONDS; warm() fills them at startup so the
+# first visitors do not wait on the database for them.
+
+REFERENCE_CACHE_SECONDS = float(os.getenv("REFERENCE_CACHE_SECONDS", 300))
+
+reference_cache = TTLCache(maxsize=8, ttl=REFERENCE_CACHE_SECONDS)
+
+REFERENCE_TABLES = {
+    "archetypes": (models.Archetype, schemas.ArchetypeResponse),
+    "tiers": (models.Tier, schemas.TierResponse),
+}
+
+
+def load(db: Session, key: str) -> list:
+    model, schema = REFERENCE_TABLES[key]
+    rows = [schema.model_validate(row) for row in db.query(model).order_by(model.id).all()]
+    reference_cache.set(key, rows)
+    return rows
+
+
+def get(db: Session, key: str) -> list:
+    rows = reference_cache.get(key)
+    return rows if rows is not None else load(db, key)
+
+
+def warm(db: Session):
+    """
+    Reloads every reference list, replacing anything cached before seeding.
+    """
+    for key in REFERENCE_TABLES:
+        load(db, key)
@@ -0,0 +1,196 @@
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+from fastapi import Request
+
+from breate_backend.slow_queries import normalize_sql
+
+# =====================================================
+# Structured request log
+# =====================================================
+# One JSON line per request on the "breate.request" logger. The request
+# middleware only builds a dict and drops a record on a bounded in-memory
+# queue; a QueueListener thread does the JSON encoding and the stdout
+# write. When the queue is full (stdout cannot keep up) records are
+# dropped and counted rather than blocking the event loop.
+#
+# Successful requests are sampled at REQUEST_LOG_SAMPLE_RATE; errors
+# (status >= 400) and requests slower than REQUEST_LOG_SLOW_MS are always
+# logged. Each line carries the rate it was sampled at so counts can be
+# scaled back up.
+
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", 1.0))
+REQUEST_LOG_SLOW_MS = float(os.getenv("REQUEST_LOG_SLOW_MS", 1000))
+REQUEST_LOG_QUEUE_SIZE = int(os.getenv("REQUEST_LOG_QUEUE_SIZE", 10000))
+
+# The request's slowest statement is logged normalized and cut to this
+# many characters
+REQUEST_LOG_SQL_CHARS = int(os.getenv("REQUEST_LOG_SQL_CHARS", 300))
+
+# Request headers copied into each line ("*" for all); sensitive ones
+# are always redacted
+REQUEST_LOG_HEADERS = {
+    name.strip().lower()
+    for name in os.getenv("REQUEST_LOG_HEADERS", "origin,user-agent").split(",")
+    if name.strip()
+}
+REDACTED_HEADERS = {
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "set-cookie",
+    "x-api-key",
+}
+REDACTED = "[redacted]"
+
+logger = logging.getLogger("breate.request")
+
+
+# -------------------------------------------------
+# Formatting (listener thread)
+# -------------------------------------------------
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        line.update(getattr(record, "request", None) or {"message": record.getMessage()})
+        return orjson.dumps(line, default=str).decode()
+
+
+# -------------------------------------------------
+# Queue handler (request path)
+# -------------------------------------------------
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks: a full queue drops the record.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records here carry a plain dict and no args; formatting is left
+        # to the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for room: the listener is still draining a full queue
+        self.queue.put(self._sentinel)
+
+
+_queue: queue.Queue = queue.Queue(maxsize=REQUEST_LOG_QUEUE_SIZE)
+_handler = DroppingQueueHandler(_queue)
+_stream = logging.StreamHandler(sys.stdout)
+_stream.setFormatter(JsonFormatter())
+_listener = DrainingQueueListener(_queue, _stream)
+
+logger.addHandler(_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def start():
+    if _listener._thread is None:
+        _listener.start()
+
+
+def stop():
+    """
+    Flushes queued lines and stops the writer thread.
+    """
+    if _listener._thread is not None:
+        _listener.stop()
+
+
+def stats() -> dict:
+    return {
+        "queued": _queue.qsize(),
+        "dropped": _handler.dropped,
+        "sample_rate": REQUEST_LOG_SAMPLE_RATE,
+    }
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+def route_template(request: Request) -> str:
+    """
+    Path pattern of the matched route ("/api/v1/projects/{project_id}"),
+    so lines group by endpoint; "unmatched" for 404s outside any route.
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def redact_headers(headers) -> dict:
+    wanted = {}
+    for name, value in headers.items():
+        if "*" not in REQUEST_LOG_HEADERS and name not in REQUEST_LOG_HEADERS:
+            continue
+        wanted[name] = REDACTED if name in REDACTED_HEADERS else value
+    return wanted
+
+
+def content_length(headers) -> int | None:
+    value = headers.get("content-length")
+    return int(value) if value and value.isdigit() else None
+
+
+def slowest_sql(stats) -> str | None:
+    if not stats.slowest_sql:
+        return None
+    return normalize_sql(stats.slowest_sql)[:REQUEST_LOG_SQL_CHARS]
+
+
+def should_log(status: int, duration_ms: float) -> bool:
+    return (
+        status >= 400
+        or duration_ms >= REQUEST_LOG_SLOW_MS
+        or random.random() < REQUEST_LOG_SAMPLE_RATE
+    )
+
+
+def log_request(request: Request, status: int, duration_ms: float, stats, response=None):
+    """
+    Queues the line for one finished request (subject to sampling).
+    """
+    if not should_log(status, duration_ms):
+        return
+
+    line = {
+        "method": request.method,
+        "route": route_template(request),
+        "path": request.url.path,
+        "status": status,
+        "duration_ms": round(duration_ms, 1),
+        "request_bytes": content_length(request.headers),
+        "response_bytes": content_length(response.headers) if response is not None else None,
+        "db_sampled": stats.sampled,
+        "db_queries": stats.queries,
+        "db_ms": round(stats.db_ms, 1),
+        "db_slowest_ms": round(stats.slowest_ms, 1),
+        "db_slowest_sql": slowest_sql(stats),
+        "pool_wait_ms": round(stats.pool_wait_ms, 1),
+        "sample_rate": 1.0 if status >= 400 or duration_ms >= REQUEST_LOG_SLOW_MS else REQUEST_LOG_SAMPLE_RATE,
+        "headers": redact_headers(request.headers),
+    }
+    level = logging.ERROR if status >= 500 else logging.WARNING if status >= 400 else logging.INFO
+    logger.log(level, "request", extra={"request": line})
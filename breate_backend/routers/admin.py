@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+
+from breate_backend import slow_queries
+from breate_backend.dependencies.auth_guard import require_admin
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+# =====================================================
+# GET: Recent slow statements (this worker)
+# =====================================================
+
+@router.get("/slow-queries")
+def get_slow_queries(limit: int = Query(50, ge=1, le=500)):
+    """
+    Admin only.
+    Statements over SLOW_QUERY_MS, newest first, with the sampled
+    EXPLAIN plan when one was taken.
+    """
+    return {
+        "threshold_ms": slow_queries.SLOW_QUERY_MS,
+        "explain_rate": slow_queries.SLOW_QUERY_EXPLAIN_RATE,
+        "entries": slow_queries.recent(limit),
+    }
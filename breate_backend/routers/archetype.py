@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from breate_backend.database import get_db
-from breate_backend import models, schemas
+from breate_backend.database import get_read_db
+from breate_backend import reference, schemas
 
 router = APIRouter(
     prefix="/archetypes",
@@ -12,10 +12,8 @@ router = APIRouter(
 # Get All Archetypes
 # -----------------------------
 @router.get("/", response_model=list[schemas.ArchetypeResponse])
-def get_archetypes(db: Session = Depends(get_db)):
+def get_archetypes(db: Session = Depends(get_read_db)):
     """
-    Returns all available archetypes.
+    Returns all available archetypes (cached per worker, see reference.py).
     """
-    archetypes = db.query(models.Archetype).all()
-    # Return empty array instead of 404 if no archetypes found
-    return archetypes or []
+    return reference.get(db, "archetypes")
@@ -1,13 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer
 from breate_backend.database import get_db
-from breate_backend import models
+from breate_backend import models, passwords
 
 # ---------------------------------------
 # CONFIG
@@ -17,7 +15,6 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
-pwd_hasher = PasswordHasher()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
@@ -39,17 +36,13 @@ class LoginRequest(BaseModel):
 # UTILS
 # ---------------------------------------
 def get_password_hash(password: str):
-    """Hash password with Argon2"""
-    return pwd_hasher.hash(password)
+    """Hash password with the shared Argon2 context"""
+    return passwords.pwd_context.hash(password)
 
 
 def verify_password(plain: str, hashed: str):
     """Verify plain password against stored hash"""
-    try:
-        pwd_hasher.verify(hashed, plain)
-        return True
-    except VerifyMismatchError:
-        return False
+    return passwords.pwd_context.verify(plain, hashed)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
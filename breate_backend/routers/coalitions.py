@@ -1,9 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from breate_backend.database import get_db
+from breate_backend.database import get_async_read_db
 from breate_backend import models
+from breate_backend.instrumentation import query_budget
+from breate_backend.pagination import clamp_limit, paginate_async
+from breate_backend.search import fuzzy_match
+from breate_backend.serializers import COALITION_CARDS, PROJECT_PAGE, Page, render
+from breate_backend.queries import (
+    CoalitionCard,
+    ProjectCard,
+    UserCard,
+    coalition_cards,
+    fetch_async,
+    project_cards,
+    user_cards,
+)
 
 router = APIRouter(
     prefix="/coalitions",
@@ -14,98 +29,132 @@ router = APIRouter(
 # GET: All coalitions (Phase 1)
 # =====================================================
 
-@router.get("/")
-def get_coalitions(
+@router.get("/", dependencies=[Depends(query_budget(2))])
+async def get_coalitions(
     search: Optional[str] = Query(None),
     region: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    sort: Optional[str] = Query(None, pattern="^(relevance|recent|members|projects)$"),
+    limit: Optional[int] = Query(None, ge=1, description="Most search results returned (capped server-side)"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Public endpoint.
     Used for Coalitions tab.
+
+    A search matches name, focus or location fuzzily and is ordered by
+    similarity unless another sort is requested. It returns the best
+    `limit` matches only (default page size), not every match.
     """
 
-    query = db.query(models.Coalition)
+    query = coalition_cards()
 
     if search:
-        s = f"%{search}%"
-        query = query.filter(
-            (models.Coalition.name.ilike(s)) |
-            (models.Coalition.focus.ilike(s)) |
-            (models.Coalition.location.ilike(s))
+        match, score = fuzzy_match(
+            db,
+            [models.Coalition.name, models.Coalition.focus, models.Coalition.location],
+            search,
         )
+        query = query.add_columns(score).filter(match).limit(clamp_limit(limit))
+        if sort in (None, "relevance"):
+            query = query.order_by(score.desc())
 
     if region:
         query = query.filter(models.Coalition.location.ilike(f"%{region}%"))
 
-    coalitions = (
-        query
-        .order_by(models.Coalition.created_at.desc())
-        .all()
-    )
+    if sort == "members":
+        query = query.order_by(query.selected_columns.member_count.desc())
+    elif sort == "projects":
+        query = query.order_by(query.selected_columns.project_count.desc())
 
-    return [
-        {
-            "id": c.id,
-            "name": c.name,
-            "description": c.description,
-            "focus": c.focus,
-            "location": c.location,
-            "member_count": len(c.members),
-            "created_at": c.created_at,
-        }
-        for c in coalitions
-    ]
+    return render(
+        COALITION_CARDS,
+        await fetch_async(db, query.order_by(models.Coalition.created_at.desc()), CoalitionCard),
+    )
 
 
 # =====================================================
 # GET: Single coalition + members (Phase 1)
 # =====================================================
 
-@router.get("/{coalition_id}")
-def get_coalition(coalition_id: int, db: Session = Depends(get_db)):
+@router.get("/{coalition_id}", dependencies=[Depends(query_budget(3))])
+async def get_coalition(coalition_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """
     Public endpoint.
     Coalition detail page.
     """
 
     coalition = (
-        db.query(models.Coalition)
-        .filter(models.Coalition.id == coalition_id)
-        .first()
-    )
+        await db.execute(
+            select(models.Coalition).where(models.Coalition.id == coalition_id)
+        )
+    ).scalar_one_or_none()
 
     if not coalition:
         raise HTTPException(status_code=404, detail="Coalition not found")
 
-    return {
+    members = await fetch_async(
+        db,
+        user_cards()
+        .join(
+            models.coalition_members,
+            models.coalition_members.c.user_id == models.User.id,
+        )
+        .where(models.coalition_members.c.coalition_id == coalition_id),
+        UserCard,
+    )
+
+    return ORJSONResponse({
         "id": coalition.id,
         "name": coalition.name,
         "description": coalition.description,
         "focus": coalition.focus,
         "location": coalition.location,
         "created_at": coalition.created_at,
-        "members": [
-            {
-                "id": u.id,
-                "username": u.username,
-                "bio": u.bio,
-                "archetype": u.archetype.name if u.archetype else None,
-                "tier": u.tier.name if u.tier else None,
-            }
-            for u in coalition.members
-        ],
-    }
-
-
-
-
-
-
+        "members": members,
+    })
 
 
+# =====================================================
+# GET: Projects tagged with a coalition
+# =====================================================
 
+@router.get("/{coalition_id}/projects", dependencies=[Depends(query_budget(2))])
+async def get_coalition_projects(
+    coalition_id: int,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped server-side)"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Public endpoint.
+    Coalition page project list, newest first, read through
+    ix_project_coalitions_coalition_project.
+    """
 
+    query = (
+        project_cards()
+        .join(
+            models.project_coalitions,
+            models.project_coalitions.c.project_id == models.Project.id,
+        )
+        .where(models.project_coalitions.c.coalition_id == coalition_id)
+    )
 
+    rows, next_cursor = await paginate_async(
+        db,
+        query,
+        [models.Project.created_at, models.Project.id],
+        cursor,
+        limit,
+        descending=True,
+    )
 
+    # An empty page may mean an unknown coalition: look it up only then
+    if not rows:
+        exists = (
+            await db.execute(select(models.Coalition.id).where(models.Coalition.id == coalition_id))
+        ).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Coalition not found")
 
+    return render(PROJECT_PAGE, Page([ProjectCard.from_row(r) for r in rows], next_cursor))
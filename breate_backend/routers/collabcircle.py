@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import and_, exists, insert, literal, or_, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from breate_backend.database import get_db
 from breate_backend import models
+from breate_backend.auth import CurrentUser
 from breate_backend.dependencies.auth_guard import get_current_user
-from pydantic import BaseModel
+from breate_backend.queries import CollabCard, collab_cards, fetch
+from breate_backend.serializers import COLLAB_CARD, COLLAB_CARDS, render
+from pydantic import BaseModel, ConfigDict
 
 router = APIRouter(
     prefix="/collabcircle",
@@ -31,8 +35,7 @@ class CollabResponse(BaseModel):
     created_at: datetime
     verified_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =====================================================
@@ -43,56 +46,55 @@ class CollabResponse(BaseModel):
 def create_collaboration(
     payload: CollabCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    collaborator = (
-        db.query(models.User)
-        .filter(models.User.username == payload.collaborator_username)
-        .first()
-    )
-
-    if not collaborator:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if collaborator.username == current_user.username:
+    if payload.collaborator_username == current_user.username:
         raise HTTPException(status_code=400, detail="Cannot collaborate with yourself")
 
-    # Prevent duplicate collaborations
-    existing = (
-        db.query(models.CollabLink)
-        .filter(
-            (
-                (models.CollabLink.user_a_username == current_user.username) &
-                (models.CollabLink.user_b_username == collaborator.username)
-            ) |
-            (
-                (models.CollabLink.user_a_username == collaborator.username) &
-                (models.CollabLink.user_b_username == current_user.username)
-            )
-        )
-        .first()
-    )
-
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="Collaboration already exists"
+    link = models.CollabLink
+    me, other = current_user.username, payload.collaborator_username
+
+    # INSERT ... SELECT from users: no row is written (or returned) when the
+    # collaborator does not exist or the pair is already linked either way
+    duplicate = exists().where(or_(
+        and_(link.user_a_username == me, link.user_b_username == other),
+        and_(link.user_a_username == other, link.user_b_username == me),
+    ))
+    collab = db.execute(
+        insert(link)
+        .from_select(
+            [
+                "user_a_username",
+                "user_b_username",
+                "project_name",
+                "status",
+                "user_a_confirmed",
+                "user_b_confirmed",
+            ],
+            select(
+                literal(me),
+                models.User.username,
+                literal(payload.project_name, link.project_name.type),
+                literal("pending"),
+                literal(1),
+                literal(0),
+            ).where(models.User.username == other, ~duplicate),
         )
+        .returning(*collab_cards().selected_columns)
+    ).first()
 
-    collab = models.CollabLink(
-        user_a_username=current_user.username,
-        user_b_username=collaborator.username,
-        project_name=payload.project_name,
-        status="pending",
-        user_a_confirmed=1,
-        user_b_confirmed=0,
-    )
+    if collab:
+        db.commit()
+        return render(COLLAB_CARD, CollabCard.from_row(collab), status_code=status.HTTP_201_CREATED)
 
-    db.add(collab)
-    db.commit()
-    db.refresh(collab)
+    # Nothing inserted: look up only to report why
+    if not db.query(models.User.id).filter(models.User.username == other).first():
+        raise HTTPException(status_code=404, detail="User not found")
 
-    return collab
+    raise HTTPException(
+        status_code=400,
+        detail="Collaboration already exists"
+    )
 
 
 # =====================================================
@@ -102,19 +104,20 @@ def create_collaboration(
 @router.get("/me", response_model=List[CollabResponse])
 def get_my_collaborations(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    collabs = (
-        db.query(models.CollabLink)
-        .filter(
+    collabs = fetch(
+        db,
+        collab_cards()
+        .where(
             (models.CollabLink.user_a_username == current_user.username) |
             (models.CollabLink.user_b_username == current_user.username)
         )
-        .order_by(models.CollabLink.created_at.desc())
-        .all()
+        .order_by(models.CollabLink.created_at.desc()),
+        CollabCard,
     )
 
-    return collabs
+    return render(COLLAB_CARDS, collabs)
 
 
 
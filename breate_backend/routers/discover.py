@@ -1,9 +1,30 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
-from breate_backend.database import get_db
+from breate_backend.database import get_async_read_db
 from breate_backend import models
+from breate_backend.instrumentation import query_budget
+from breate_backend.pagination import paginate_async
+from breate_backend.search import fuzzy_match, search_projects
+from breate_backend.serializers import (
+    PROJECT_CARDS,
+    PROJECT_PAGE,
+    USER_CARDS,
+    USER_PAGE,
+    Page,
+    render,
+)
+from breate_backend.queries import (
+    ProjectCard,
+    UserCard,
+    fetch_async,
+    needs_archetypes,
+    project_cards,
+    split_tags,
+    tagged_with_coalition,
+    user_cards,
+)
 
 router = APIRouter(
     prefix="/discover",
@@ -14,24 +35,31 @@ router = APIRouter(
 # 1️⃣ USER DISCOVERY (Phase 1)
 # =====================================================
 
-@router.get("/users")
-def discover_users(
+@router.get("/users", dependencies=[Depends(query_budget(2))])
+async def discover_users(
     username: Optional[str] = Query(None, description="Search by username"),
     archetype_id: Optional[int] = Query(None),
     tier_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped server-side)"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Public endpoint.
     Used by frontend Discover tab to find creators.
+
+    Passing `cursor` or `limit` switches to keyset pagination ordered by
+    user id and returns {"items": [...], "next_cursor": ...}. A username
+    search is ordered by match similarity instead, best first.
     """
 
-    query = db.query(models.User)
+    query = user_cards()
+    order_by, descending = [models.User.id], False
 
     if username:
-        query = query.filter(
-            models.User.username.ilike(f"%{username}%")
-        )
+        match, score = fuzzy_match(db, [models.User.username], username)
+        query = query.add_columns(score).filter(match)
+        order_by, descending = [score, models.User.id], True
 
     if archetype_id:
         query = query.filter(
@@ -43,43 +71,63 @@ def discover_users(
             models.User.tier_id == tier_id
         )
 
-    users = query.all()
-
-    return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "bio": user.bio,
-            "archetype": user.archetype.name if user.archetype else None,
-            "tier": user.tier.name if user.tier else None,
-        }
-        for user in users
-    ]
+    if cursor is not None or limit is not None:
+        rows, next_cursor = await paginate_async(db, query, order_by, cursor, limit, descending=descending)
+        return render(USER_PAGE, Page([UserCard.from_row(r) for r in rows], next_cursor))
+
+    return render(
+        USER_CARDS,
+        await fetch_async(
+            db,
+            query.order_by(*[c.desc() if descending else c.asc() for c in order_by]),
+            UserCard,
+        ),
+    )
 
 
 # =====================================================
 # 2️⃣ PROJECT DISCOVERY (Phase 1)
 # =====================================================
 
-@router.get("/projects")
-def discover_projects(
-    archetype: Optional[str] = Query(
+@router.get("/projects", dependencies=[Depends(query_budget(2))])
+async def discover_projects(
+    q: Optional[str] = Query(None, description="Full-text search over title and objective"),
+    archetype: Optional[List[str]] = Query(
         None,
-        description="Filter by needed archetype (string match)"
+        description="Filter by needed archetype name (repeat or comma-separate for several)"
+    ),
+    archetype_match: str = Query(
+        "any",
+        pattern="^(any|all)$",
+        description="Require any or all of the given archetypes"
     ),
     region: Optional[str] = Query(None),
     coalition: Optional[str] = Query(
         None,
-        description="Filter by coalition tag"
+        description="Filter by coalition name"
     ),
-    db: Session = Depends(get_db),
+    coalition_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped server-side)"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Public endpoint.
     Returns OPEN projects only (Phase 1 rule).
+
+    Passing `cursor` or `limit` switches to keyset pagination over
+    (created_at, id) and returns {"items": [...], "next_cursor": ...}.
+    With `q`, results are ranked by text relevance and paged over
+    (rank, id) instead.
     """
 
-    query = db.query(models.Project)
+    query = project_cards()
+    order_by = [models.Project.created_at, models.Project.id]
+
+    if q and q.strip():
+        query, rank = search_projects(db, query, q)
+        query = query.add_columns(rank)
+        order_by = [rank, models.Project.id]
 
     # Phase 1: only open projects
     query = query.filter(
@@ -91,37 +139,22 @@ def discover_projects(
             models.Project.region.ilike(f"%{region}%")
         )
 
-    if archetype:
+    archetypes = split_tags(archetype)
+    if archetypes:
         query = query.filter(
-            models.Project.needed_archetypes.ilike(f"%{archetype}%")
+            needs_archetypes(archetypes, match_all=archetype_match == "all")
         )
 
-    if coalition:
+    if coalition or coalition_id:
         query = query.filter(
-            models.Project.coalition_tags.ilike(f"%{coalition}%")
+            tagged_with_coalition(name=coalition, coalition_id=coalition_id)
         )
 
-    projects = (
-        query
-        .order_by(models.Project.created_at.desc())
-        .all()
-    )
+    if cursor is not None or limit is not None:
+        rows, next_cursor = await paginate_async(db, query, order_by, cursor, limit, descending=True)
+        return render(PROJECT_PAGE, Page([ProjectCard.from_row(r) for r in rows], next_cursor))
 
-    return [
-        {
-            "id": project.id,
-            "title": project.title,
-            "objective": project.objective,
-            "project_type": project.project_type,
-            "needed_archetypes": project.needed_archetypes.split(","),
-            "region": project.region,
-            "coalition_tags": (
-                project.coalition_tags.split(",")
-                if project.coalition_tags else []
-            ),
-            "status": project.status.value,
-            "created_at": project.created_at,
-            "poster_id": project.poster_id,
-        }
-        for project in projects
-    ]
+    return render(
+        PROJECT_CARDS,
+        await fetch_async(db, query.order_by(*[c.desc() for c in order_by]), ProjectCard),
+    )
@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
-from breate_backend.database import get_db
+from breate_backend.database import get_async_read_db, get_db
 from breate_backend import models
+from breate_backend.auth import CurrentUser, invalidate_user
 from breate_backend.dependencies.auth_guard import get_current_user
+from breate_backend.instrumentation import query_budget
 
 router = APIRouter(
     prefix="/profile",
@@ -13,16 +17,21 @@ router = APIRouter(
 # ----------------------------------------------------
 # GET: Public user profile
 # ----------------------------------------------------
-@router.get("/{username}")
-def get_profile(
+@router.get("/{username}", dependencies=[Depends(query_budget(2))])
+async def get_profile(
     username: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     user = (
-        db.query(models.User)
-        .filter(models.User.username == username)
-        .first()
-    )
+        await db.execute(
+            select(models.User)
+            .options(
+                joinedload(models.User.archetype),
+                joinedload(models.User.tier),
+            )
+            .where(models.User.username == username)
+        )
+    ).scalar_one_or_none()
 
     if not user:
         raise HTTPException(
@@ -53,7 +62,7 @@ def update_profile(
     username: str,
     data: dict,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     if current_user.username != username:
         raise HTTPException(
@@ -61,18 +70,6 @@ def update_profile(
             detail="You are not allowed to edit this profile"
         )
 
-    user = (
-        db.query(models.User)
-        .filter(models.User.id == current_user.id)
-        .first()
-    )
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
     allowed_fields = {
         "full_name",
         "bio",
@@ -82,12 +79,24 @@ def update_profile(
         "affiliations",
     }
 
-    for field in allowed_fields:
-        if field in data:
-            setattr(user, field, data[field])
+    changes = {field: data[field] for field in allowed_fields if field in data}
+
+    if changes:
+        user = db.execute(
+            update(models.User)
+            .where(models.User.id == current_user.id)
+            .values(**changes)
+            .returning(models.User.id, models.User.email)
+        ).first()
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
 
-    db.commit()
-    db.refresh(user)
+        db.commit()
+        invalidate_user(user.id, user.email)
 
     return {
         "message": "Profile updated successfully"
@@ -1,13 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
 
-from breate_backend.database import get_db
+from breate_backend.database import get_async_read_db, get_db
 from breate_backend import models
+from breate_backend.auth import CurrentUser
 from breate_backend.dependencies.auth_guard import get_current_user
+from breate_backend.instrumentation import query_budget
+from breate_backend.pagination import paginate_async
+from breate_backend.queries import (
+    ProjectCard,
+    fetch_async,
+    link_project_archetypes,
+    link_project_coalitions,
+    project_cards,
+)
+from breate_backend.serializers import PROJECT_CARD, PROJECT_CARDS, PROJECT_PAGE, Page, render
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 router = APIRouter(
@@ -45,14 +58,21 @@ class ProjectResponse(ProjectBase):
     status: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectPage(BaseModel):
+    items: List[ProjectResponse]
+    next_cursor: Optional[str]
 
 
 # ====================================================
 # Helpers
 # ====================================================
 
+# Keyset order of the feed (newest first); matches ix_projects_created_at_id
+FEED_ORDER = [models.Project.created_at, models.Project.id]
+
 VALID_STATUS_FLOW = {
     "open": "in_progress",
     "in_progress": "completed",
@@ -78,32 +98,37 @@ def validate_status_transition(current: str, new: str):
 # GET: Public project feed
 # ====================================================
 
-@router.get("/", response_model=List[ProjectResponse])
-def get_projects(db: Session = Depends(get_db)):
-    projects = (
-        db.query(models.Project)
-        .order_by(models.Project.created_at.desc())
-        .all()
+@router.get(
+    "/",
+    response_model=Union[ProjectPage, List[ProjectResponse]],
+    dependencies=[Depends(query_budget(2))],
+)
+async def get_projects(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped server-side)"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Public project feed, newest first.
+
+    Passing `cursor` or `limit` switches to keyset pagination over
+    (created_at, id) and returns {"items": [...], "next_cursor": ...}.
+    """
+    query = project_cards()
+
+    if cursor is not None or limit is not None:
+        rows, next_cursor = await paginate_async(db, query, FEED_ORDER, cursor, limit, descending=True)
+        return render(PROJECT_PAGE, Page([ProjectCard.from_row(r) for r in rows], next_cursor))
+
+    return render(
+        PROJECT_CARDS,
+        await fetch_async(
+            db,
+            query.order_by(models.Project.created_at.desc(), models.Project.id.desc()),
+            ProjectCard,
+        ),
     )
 
-    return [
-        ProjectResponse(
-            id=p.id,
-            title=p.title,
-            objective=p.objective,
-            project_type=p.project_type,
-            needed_archetypes=p.needed_archetypes.split(","),
-            open_roles=p.open_roles,
-            timeline=p.timeline,
-            region=p.region,
-            coalition_tags=p.coalition_tags.split(",") if p.coalition_tags else [],
-            poster_id=p.poster_id,
-            status=p.status.value,
-            created_at=p.created_at,
-        )
-        for p in projects
-    ]
-
 
 # ====================================================
 # POST: Create project (AUTH REQUIRED)
@@ -113,67 +138,45 @@ def get_projects(db: Session = Depends(get_db)):
 def create_project(
     project: ProjectCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    new_project = models.Project(
-        title=project.title,
-        objective=project.objective,
-        project_type=project.project_type,
-        needed_archetypes=",".join(project.needed_archetypes),
-        open_roles=project.open_roles,
-        timeline=project.timeline,
-        region=project.region,
-        coalition_tags=",".join(project.coalition_tags),
-        poster_id=current_user.id,
-    )
+    new_project = db.execute(
+        insert(models.Project)
+        .values(
+            title=project.title,
+            objective=project.objective,
+            project_type=project.project_type,
+            needed_archetypes=",".join(project.needed_archetypes),
+            open_roles=project.open_roles,
+            timeline=project.timeline,
+            region=project.region,
+            coalition_tags=",".join(project.coalition_tags),
+            poster_id=current_user.id,
+        )
+        .returning(*project_cards().selected_columns)
+    ).one()
 
-    db.add(new_project)
+    link_project_archetypes(db, new_project.id, project.needed_archetypes)
+    link_project_coalitions(db, new_project.id, project.coalition_tags)
     db.commit()
-    db.refresh(new_project)
-
-    return ProjectResponse(
-        id=new_project.id,
-        title=new_project.title,
-        objective=new_project.objective,
-        project_type=new_project.project_type,
-        needed_archetypes=new_project.needed_archetypes.split(","),
-        open_roles=new_project.open_roles,
-        timeline=new_project.timeline,
-        region=new_project.region,
-        coalition_tags=new_project.coalition_tags.split(",") if new_project.coalition_tags else [],
-        poster_id=new_project.poster_id,
-        status=new_project.status.value,
-        created_at=new_project.created_at,
-    )
+
+    return render(PROJECT_CARD, ProjectCard.from_row(new_project), status_code=status.HTTP_201_CREATED)
 
 
 # ====================================================
 # GET: Single project
 # ====================================================
 
-@router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(
-        models.Project.id == project_id
+@router.get("/{project_id}", response_model=ProjectResponse, dependencies=[Depends(query_budget(2))])
+async def get_project(project_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    project = (
+        await db.execute(project_cards().where(models.Project.id == project_id))
     ).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return ProjectResponse(
-        id=project.id,
-        title=project.title,
-        objective=project.objective,
-        project_type=project.project_type,
-        needed_archetypes=project.needed_archetypes.split(","),
-        open_roles=project.open_roles,
-        timeline=project.timeline,
-        region=project.region,
-        coalition_tags=project.coalition_tags.split(",") if project.coalition_tags else [],
-        poster_id=project.poster_id,
-        status=project.status.value,
-        created_at=project.created_at,
-    )
+    return render(PROJECT_CARD, ProjectCard.from_row(project))
 
 
 # ====================================================
@@ -185,9 +188,44 @@ def update_project_status(
     project_id: int,
     payload: ProjectStatusUpdate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    project = db.query(models.Project).filter(
+    new_status = payload.status
+
+    if new_status not in models.ProjectStatus.__members__:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid project status"
+        )
+
+    # Ownership and the allowed transition are part of the UPDATE itself,
+    # so a concurrent status change cannot slip in between check and write
+    from_statuses = [
+        models.ProjectStatus[current]
+        for current, allowed_next in VALID_STATUS_FLOW.items()
+        if allowed_next == new_status
+    ]
+    values = {"status": models.ProjectStatus[new_status]}
+    if new_status == "completed":
+        values["completed_at"] = datetime.utcnow()
+
+    project = db.execute(
+        update(models.Project)
+        .where(
+            models.Project.id == project_id,
+            models.Project.poster_id == current_user.id,
+            models.Project.status.in_(from_statuses),
+        )
+        .values(**values)
+        .returning(*project_cards().selected_columns)
+    ).first()
+
+    if project:
+        db.commit()
+        return render(PROJECT_CARD, ProjectCard.from_row(project))
+
+    # Nothing updated: look the project up only to report why
+    project = db.query(models.Project.poster_id, models.Project.status).filter(
         models.Project.id == project_id
     ).first()
 
@@ -200,38 +238,8 @@ def update_project_status(
             detail="You are not allowed to update this project"
         )
 
-    new_status = payload.status
-
-    if new_status not in models.ProjectStatus.__members__:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid project status"
-        )
-
-    current_status = project.status.value
-    validate_status_transition(current_status, new_status)
-
-    project.status = models.ProjectStatus[new_status]
-    if new_status == "completed":
-        project.completed_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(project)
-
-    return ProjectResponse(
-        id=project.id,
-        title=project.title,
-        objective=project.objective,
-        project_type=project.project_type,
-        needed_archetypes=project.needed_archetypes.split(","),
-        open_roles=project.open_roles,
-        timeline=project.timeline,
-        region=project.region,
-        coalition_tags=project.coalition_tags.split(",") if project.coalition_tags else [],
-        poster_id=project.poster_id,
-        status=project.status.value,
-        created_at=project.created_at,
-    )
+    validate_status_transition(project.status.value, new_status)
+    raise HTTPException(status_code=409, detail="Project status changed, reload and retry")
 
 
 # ====================================================
@@ -242,7 +250,7 @@ def update_project_status(
 def delete_project(
     project_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     project = db.query(models.Project).filter(
         models.Project.id == project_id
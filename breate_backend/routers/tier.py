@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from breate_backend.database import get_db
-from breate_backend import models, schemas
+from breate_backend.database import get_read_db
+from breate_backend import reference, schemas
 
 router = APIRouter(
     prefix="/tiers",
@@ -12,10 +12,8 @@ router = APIRouter(
 # Get All Tiers
 # -----------------------------
 @router.get("/", response_model=list[schemas.TierResponse])
-def get_tiers(db: Session = Depends(get_db)):
+def get_tiers(db: Session = Depends(get_read_db)):
     """
-    Returns all available tiers.
+    Returns all available tiers (cached per worker, see reference.py).
     """
-    tiers = db.query(models.Tier).all()
-    # Return empty array instead of 404 if no tiers found
-    return tiers or []
+    return reference.get(db, "tiers")
@@ -1,12 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Response, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from passlib.context import CryptContext
 from breate_backend.database import get_db
-from breate_backend import models, schemas
+from breate_backend.queries import insert_or_skip, is_unique_violation
+from breate_backend import models, rate_limit, schemas
+from breate_backend.passwords import hash_password, verify_and_update
 from breate_backend.auth import (
     create_access_token,
     create_refresh_token,
+    resolve_user,
+    token_claims,
     verify_access_token,
     verify_refresh_token
 )
@@ -16,42 +22,90 @@ router = APIRouter(
     tags=["Users"]
 )
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
 
+# -----------------------------
+# Helpers
+# -----------------------------
+# signup and login are async so that waiting on the argon2 pool does not
+# hold an AnyIO worker thread. Their DB steps still use the sync session,
+# so they go through run_in_threadpool, and each one ends its transaction
+# to hand the pooled connection back before any hashing starts.
+def find_credentials(db: Session, email: str):
+    row = db.execute(
+        select(models.User.id, models.User.email, models.User.password)
+        .where(models.User.email == email)
+    ).first()
+    db.rollback()
+    return row
+
+
+def store_password_hash(db: Session, user_id: int, hashed_password: str):
+    db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(password=hashed_password)
+    )
+    db.commit()
+
+
+def insert_user(db: Session, user: schemas.UserCreate, hashed_password: str):
+    """
+    One INSERT ... ON CONFLICT (email) DO NOTHING RETURNING; no row back
+    means the email is taken, even if another signup raced this one. A
+    unique violation that still gets through means the same.
+    """
+    u = models.User
+    try:
+        row = db.execute(
+            insert_or_skip(db, u, [u.email])
+            .values(
+                email=user.email,
+                password=hashed_password,
+                archetype_id=user.archetype_id,
+                tier_id=user.tier_id
+            )
+            .returning(u.id, u.email, u.username, u.bio, u.archetype_id, u.tier_id)
+        ).first()
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        if is_unique_violation(error):
+            raise HTTPException(status_code=400, detail="Email already registered")
+        raise HTTPException(status_code=400, detail="Unknown archetype or tier")
+
+    if row is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    return schemas.UserResponse.model_validate(row)
+
+
 # -----------------------------
 # Signup Endpoint
 # -----------------------------
 @router.post("/signup", response_model=schemas.UserResponse)
-def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def signup(
+    user: schemas.UserCreate,
+    request: Request,
+    db: Session = Depends(get_db)
+):
     """
     Register a new user.
     Requires: email, password, archetype_id, tier_id.
     """
-    existing_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
+    await rate_limit.limit(request, "signup:ip", rate_limit.SIGNUP_PER_IP)
 
-    hashed_password = pwd_context.hash(user.password)
-    new_user = models.User(
-        email=user.email,
-        password=hashed_password,
-        archetype_id=user.archetype_id,
-        tier_id=user.tier_id
-    )
-
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
+    hashed_password = await hash_password(user.password)
+    return await run_in_threadpool(insert_user, db, user, hashed_password)
 
 
 # -----------------------------
 # Login Endpoint (Form + Cookies)
 # -----------------------------
 @router.post("/login", response_model=schemas.Token)
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     response: Response = None,
     db: Session = Depends(get_db)
@@ -59,16 +113,30 @@ def login(
     """
     Authenticates a user and returns access + refresh tokens.
     """
-    user = db.query(models.User).filter(models.User.email == form_data.username).first()
-
-    if not user or not pwd_context.verify(form_data.password, user.password):
+    # Throttle before any DB lookup or argon2 work. The account limit only
+    # counts wrong passwords, so a correct one is never what locks it
+    account = form_data.username.strip().lower()
+    await rate_limit.limit(request, "login:ip", rate_limit.LOGIN_PER_IP)
+    await rate_limit.check("login:email", account, rate_limit.LOGIN_PER_EMAIL)
+    user = await run_in_threadpool(find_credentials, db, form_data.username)
+
+    valid, new_hash = (
+        await verify_and_update(form_data.password, user.password) if user else (False, None)
+    )
+    if not valid:
+        await rate_limit.record_failure("login:email", account, rate_limit.LOGIN_PER_EMAIL)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
-    access_token = create_access_token(data={"sub": user.email, "type": "access"})
-    refresh_token = create_refresh_token(data={"sub": user.email, "type": "refresh"})
+    # Stored under outdated argon2 parameters: upgrade while we have the
+    # plaintext in hand
+    if new_hash:
+        await run_in_threadpool(store_password_hash, db, user.id, new_hash)
+
+    access_token = create_access_token(data={**token_claims(user), "type": "access"})
+    refresh_token = create_refresh_token(data={**token_claims(user), "type": "refresh"})
 
     if response:
         response.set_cookie(
@@ -105,7 +173,7 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except Exception as e:
         raise HTTPException(status_code=401, detail=str(e))
 
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = resolve_user(payload, db)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -132,5 +200,8 @@ def refresh_token(request: Request):
     except Exception as e:
         raise HTTPException(status_code=401, detail=str(e))
 
-    new_access_token = create_access_token({"sub": email, "type": "access"})
+    claims = {"sub": email, "type": "access"}
+    if payload.get("uid") is not None:
+        claims["uid"] = payload["uid"]
+    new_access_token = create_access_token(claims)
     return {"access_token": new_access_token, "token_type": "bearer"}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional, List
 from datetime import datetime
 
@@ -41,8 +41,7 @@ class UserResponse(BaseModel):
     archetype_id: int
     tier_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =====================================================
@@ -54,8 +53,7 @@ class ArchetypeResponse(BaseModel):
     name: str
     description: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TierResponse(BaseModel):
@@ -64,8 +62,7 @@ class TierResponse(BaseModel):
     level: int
     description: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =====================================================
@@ -88,16 +85,14 @@ class CoalitionMember(BaseModel):
     email: EmailStr
     username: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CoalitionOut(CoalitionBase):
     id: int
     members: List[CoalitionMember] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =====================================================
@@ -129,8 +124,7 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =====================================================
@@ -159,8 +153,7 @@ class CollabCircleEntry(BaseModel):
     project_title: Optional[str]
     verified_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 
@@ -0,0 +1,90 @@
+from sqlalchemy import Double, Float, case, cast, column, func, literal, literal_column, or_, table
+from sqlalchemy.orm import Session
+
+from breate_backend import models
+
+# =====================================================
+# Fuzzy text search
+# =====================================================
+# Postgres: pg_trgm. ILIKE '%q%' and the `%` similarity operator are both
+# served by the gin_trgm_ops indexes declared in models.py, and results
+# are ranked by similarity().
+#
+# SQLite (local/tests): plain substring match, ranked by how much of the
+# value the search term covers.
+
+
+def is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def fuzzy_match(db: Session, columns, term: str):
+    """
+    Returns (predicate, score) for a fuzzy search of `term` over `columns`.
+
+    `score` is labelled "score"; higher is a better match.
+    """
+    term = term.strip()
+
+    if is_postgres(db):
+        predicates = [
+            or_(column.icontains(term, autoescape=True), column.op("%")(term))
+            for column in columns
+        ]
+        scores = [func.similarity(column, term, type_=Float) for column in columns]
+        score = scores[0] if len(scores) == 1 else func.greatest(*scores, type_=Float)
+    else:
+        predicates = [column.icontains(term, autoescape=True) for column in columns]
+        scores = [
+            case(
+                (
+                    column.icontains(term, autoescape=True),
+                    literal(float(len(term))) / func.length(column),
+                ),
+                else_=0.0,
+            )
+            for column in columns
+        ]
+        score = scores[0] if len(scores) == 1 else func.max(*scores, type_=Float)
+
+    return or_(*predicates), score.label("score")
+
+
+# =====================================================
+# Project full-text search
+# =====================================================
+# Postgres: projects.search_vector @@ websearch_to_tsquery(), ranked by
+# ts_rank() and served by ix_projects_search_vector (GIN).
+# SQLite: the projects_fts FTS5 table, ranked by bm25().
+
+projects_fts = table("projects_fts", column("rowid"), column("rank"))
+
+
+def fts5_query(q: str) -> str:
+    """
+    Quotes each word so user input cannot inject FTS5 query syntax.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in q.split())
+
+
+def search_projects(db: Session, query, q: str):
+    """
+    Restricts a Project query to rows matching `q`.
+
+    Returns (query, rank); `rank` is labelled "rank", higher is better.
+    """
+    if is_postgres(db):
+        vector = literal_column("projects.search_vector")
+        tsquery = func.websearch_to_tsquery("english", q)
+        query = query.filter(vector.op("@@")(tsquery))
+        # Double precision so cursor values round-trip exactly
+        rank = cast(func.ts_rank(vector, tsquery), Double)
+    else:
+        query = (
+            query
+            .join(projects_fts, projects_fts.c.rowid == models.Project.id)
+            .filter(literal_column("projects_fts").op("MATCH")(fts5_query(q)))
+        )
+        rank = cast(-projects_fts.c.rank, Double)
+
+    return query, rank.label("rank")
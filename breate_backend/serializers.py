@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from breate_backend.queries import CoalitionCard, CollabCard, ProjectCard, UserCard
+
+# =====================================================
+# Response serialization
+# =====================================================
+# Read endpoints build trusted cards from queries.py and hand them to a
+# TypeAdapter compiled once at import. dump_json() encodes straight to
+# bytes in pydantic-core: the payload is never re-validated against a
+# response_model nor walked by jsonable_encoder. Returning a Response also
+# makes FastAPI skip its own response_model pass; response_model stays on
+# the routes for the OpenAPI docs only.
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+USER_CARDS = TypeAdapter(list[UserCard])
+USER_PAGE = TypeAdapter(Page[UserCard])
+
+PROJECT_CARD = TypeAdapter(ProjectCard)
+PROJECT_CARDS = TypeAdapter(list[ProjectCard])
+PROJECT_PAGE = TypeAdapter(Page[ProjectCard])
+
+COALITION_CARDS = TypeAdapter(list[CoalitionCard])
+
+COLLAB_CARD = TypeAdapter(CollabCard)
+COLLAB_CARDS = TypeAdapter(list[CollabCard])
+
+
+def render(adapter: TypeAdapter, value, status_code: int = 200) -> Response:
+    """
+    Encodes `value` with a precompiled adapter into a JSON response.
+    """
+    return Response(
+        content=adapter.dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
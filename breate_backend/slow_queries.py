@@ -0,0 +1,207 @@
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("breate.slow_query")
+
+# -------------------------------------------------
+# Config
+# -------------------------------------------------
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 200))
+SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_RATE", 0.1))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", 100))
+
+# =====================================================
+# Slow-statement log
+# =====================================================
+# Every statement is timed on the engine; those over SLOW_QUERY_MS land
+# in a per-worker ring buffer (served on /admin/slow-queries) and the
+# breate.slow_query logger. A sampled fraction also gets its plan:
+# EXPLAIN (ANALYZE, BUFFERS) on Postgres, EXPLAIN QUERY PLAN on SQLite.
+#
+# Plans are fetched off the request path (a one-thread executor for sync
+# engines, a loop task for async ones), outside the request's context, on
+# a fresh pooled connection, one at a time; a sample arriving while
+# another plan is running is skipped. ANALYZE executes the statement, so
+# only plain SELECTs are explained and the transaction is always rolled
+# back.
+
+entries: deque = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+
+_explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+_explaining = threading.Lock()
+_tasks = set()  # strong refs so pending explain tasks are not collected
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+|:\w+))+\s*\)")
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Collapses whitespace, inlined literals and IN-lists so repeats of
+    one query shape read alike.
+    """
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    return _IN_LIST.sub("(...)", sql)
+
+
+def param_shape(value):
+    if isinstance(value, (str, bytes, list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def parameter_shapes(parameters, executemany: bool):
+    """
+    Types (and lengths) of the bound values, never the values themselves.
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "first": parameter_shapes(rows[0], False) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: param_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [param_shape(value) for value in parameters]
+    return None
+
+
+def explainable(statement: str) -> bool:
+    head = statement.lstrip().upper()
+    return head.startswith("SELECT") or (head.startswith("WITH") and not _WRITES.search(statement))
+
+
+def explain_sql(dialect_name: str, statement: str) -> str:
+    if dialect_name == "postgresql":
+        return "EXPLAIN (ANALYZE, BUFFERS) " + statement
+    return "EXPLAIN QUERY PLAN " + statement
+
+
+def format_plan(rows) -> str:
+    return "\n".join(" | ".join(str(col) for col in row) for row in rows)
+
+
+def explain_sync(engine, entry: dict, statement: str, parameters):
+    try:
+        with engine.connect() as conn:
+            conn.info["explaining"] = True
+            try:
+                rows = conn.exec_driver_sql(
+                    explain_sql(engine.dialect.name, statement), parameters
+                ).all()
+                conn.rollback()
+            finally:
+                conn.info.pop("explaining", None)
+        entry["plan"] = format_plan(rows)
+    except Exception as exc:
+        entry["plan_error"] = str(exc)
+    finally:
+        _explaining.release()
+
+
+async def explain_async(engine: AsyncEngine, entry: dict, statement: str, parameters):
+    try:
+        async with engine.connect() as conn:
+            conn.info["explaining"] = True
+            try:
+                result = await conn.exec_driver_sql(
+                    explain_sql(engine.dialect.name, statement), parameters
+                )
+                rows = result.all()
+                await conn.rollback()
+            finally:
+                conn.info.pop("explaining", None)
+        entry["plan"] = format_plan(rows)
+    except Exception as exc:
+        entry["plan_error"] = str(exc)
+    finally:
+        _explaining.release()
+
+
+def watch_slow_queries(name: str, engine):
+    async_engine = engine if isinstance(engine, AsyncEngine) else None
+    target = engine.sync_engine if async_engine else engine
+
+    @event.listens_for(target, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get("explaining"):
+            return
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("slow_query_start")
+        if not started:
+            return
+        duration_ms = (time.perf_counter() - started.pop()) * 1000
+        if duration_ms < SLOW_QUERY_MS:
+            return
+
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "engine": name,
+            "duration_ms": round(duration_ms, 1),
+            "sql": normalize_sql(statement),
+            "params": parameter_shapes(parameters, executemany),
+            "plan": None,
+        }
+        entries.append(entry)
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s", duration_ms, name, entry["sql"],
+            extra={"slow_query": entry},
+        )
+
+        if (
+            executemany
+            or random.random() >= SLOW_QUERY_EXPLAIN_RATE
+            or not explainable(statement)
+            or not _explaining.acquire(blocking=False)
+        ):
+            return
+
+        # A fresh context, so the plan's own statements and pool checkout
+        # are not counted against the request that triggered it
+        try:
+            if async_engine:
+                task = asyncio.get_running_loop().create_task(
+                    explain_async(async_engine, entry, statement, parameters),
+                    context=contextvars.Context(),
+                )
+                _tasks.add(task)
+                task.add_done_callback(_tasks.discard)
+            else:
+                _explainer.submit(
+                    contextvars.Context().run, explain_sync, engine, entry, statement, parameters
+                )
+        except Exception:
+            _explaining.release()
+
+    @event.listens_for(target, "handle_error")
+    def on_error(exception_context):
+        conn = exception_context.connection
+        started = conn.info.get("slow_query_start") if conn is not None else None
+        if started:
+            started.pop()
+
+
+def recent(limit: int | None = None) -> list[dict]:
+    """
+    Newest first.
+    """
+    items = list(entries)[::-1]
+    return items[:limit] if limit else items
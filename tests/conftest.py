@@ -0,0 +1,146 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Point the app at a throwaway SQLite file before anything imports
+# breate_backend.database (which would otherwise read .env)
+_db_dir = tempfile.mkdtemp(prefix="breate-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ["READ_STICKY_SECONDS"] = "5"
+os.environ["ARGON2_TIME_COST"] = "1"
+os.environ["ARGON2_MEMORY_COST"] = "19456"
+os.environ["ARGON2_PARALLELISM"] = "1"
+os.environ["REQUEST_LOG_SAMPLE_RATE"] = "0"
+os.environ["SLOW_QUERY_MS"] = "100000"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, insert
+
+from breate_backend import auth, models
+from breate_backend.database import SessionLocal, async_engine, engine
+from breate_backend.main import app
+from breate_backend.rate_limit import limiter
+
+# Rows created by tests; reference data (archetypes, tiers, coalitions
+# seeded at startup) is left in place
+TEST_TABLES = [
+    models.project_archetypes,
+    models.project_coalitions,
+    models.coalition_members,
+    models.ProjectParticipant.__table__,
+    models.CollabLink.__table__,
+    models.Project.__table__,
+    models.User.__table__,
+]
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        assert client.get("/api/v1/archetypes/").status_code == 200  # waits for warm-up
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def clean_state(client):
+    yield
+    with engine.begin() as conn:
+        for table in TEST_TABLES:
+            conn.execute(delete(table))
+    client.cookies.clear()
+    auth.token_cache.clear()
+    auth.identity_cache.clear()
+    limiter.backend.clear()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __len__(self):
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+
+    def __call__(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def queries():
+    """
+    Records every statement sent on the sync and async engines.
+    """
+    counter = QueryCounter()
+    targets = [engine, async_engine.sync_engine]
+    for target in targets:
+        event.listen(target, "before_cursor_execute", counter)
+    yield counter
+    for target in targets:
+        event.remove(target, "before_cursor_execute", counter)
+
+
+# -------------------------------------------------
+# Data helpers
+# -------------------------------------------------
+def make_users(db, count: int, prefix: str = "user") -> list[int]:
+    rows = db.execute(
+        insert(models.User).returning(models.User.id),
+        [
+            {
+                "email": f"{prefix}{i}@example.com",
+                "password": "x",
+                "username": f"{prefix}{i}",
+                "archetype_id": 1 + i % 4,
+                "tier_id": 1 + i % 3,
+            }
+            for i in range(count)
+        ],
+    ).scalars().all()
+    db.commit()
+    return rows
+
+
+def make_projects(db, count: int, poster_id: int | None = None, timestamps: bool = False) -> list[int]:
+    """
+    Inserts `count` open projects. Without `timestamps` created_at comes
+    from the server default (all in the same second); with it, explicit
+    datetimes a few microseconds apart are mixed in, as the ORM writes them.
+    """
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    ids = []
+    for i in range(count):
+        values = {
+            "title": f"Project {i}",
+            "objective": "Build something",
+            "project_type": "app",
+            "needed_archetypes": "Creator",
+            "coalition_tags": "",
+            "poster_id": poster_id,
+        }
+        if timestamps and i % 2:
+            values["created_at"] = base + timedelta(microseconds=i)
+        ids.append(db.execute(insert(models.Project).values(**values).returning(models.Project.id)).scalar_one())
+    db.commit()
+    return ids
+
+
+def signup_and_login(client, email: str = "member@example.com", password: str = "secret") -> dict:
+    client.post(
+        "/api/v1/users/signup",
+        json={"email": email, "password": password, "archetype_id": 1, "tier_id": 1},
+    )
+    response = client.post("/api/v1/users/login", data={"username": email, "password": password})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from sqlalchemy import update
+
+from breate_backend import auth, models
+from conftest import signup_and_login
+
+
+def me(client, headers: dict):
+    return client.get("/api/v1/users/me", headers=headers)
+
+
+@pytest.fixture
+def member(client, db) -> tuple[dict, int]:
+    """
+    A signed-up user with a username (signup does not set one), whose
+    identity is already cached.
+    """
+    headers = signup_and_login(client, "cached@example.com", "secret")
+    user_id = me(client, headers).json()["id"]
+    db.execute(update(models.User).where(models.User.id == user_id).values(username="cached"))
+    db.commit()
+    auth.invalidate_user(user_id)
+    assert me(client, headers).json()["bio"] is None
+    assert auth.identity_cache.get(("uid", user_id)) is not None
+    return headers, user_id
+
+
+def test_profile_update_is_seen_straight_away(client, member):
+    headers, _ = member
+
+    response = client.put("/api/v1/profile/cached", json={"bio": "Muralist"}, headers=headers)
+    assert response.status_code == 200
+
+    assert me(client, headers).json()["bio"] == "Muralist"
+
+
+def test_deleted_user_is_not_served_from_the_cache(client, db, member):
+    headers, user_id = member
+
+    db.delete(db.get(models.User, user_id))
+    db.commit()
+
+    assert me(client, headers).status_code == 404
+
+
+def test_token_memo_expires_with_the_token():
+    exp = int(time.time()) + 1
+    token = jwt.encode({"sub": "memo@example.com", "uid": 1, "exp": exp}, auth.SECRET_KEY, algorithm=auth.ALGORITHM)
+
+    assert auth.verify_access_token(token)["sub"] == "memo@example.com"
+    [(expires_at, _)] = auth.token_cache._data.values()
+    assert expires_at - time.monotonic() <= exp - time.time() + 0.05
+
+    # python-jose compares exp with the current whole second
+    while int(time.time()) <= exp:
+        time.sleep(0.05)
+
+    misses = auth.token_cache.misses
+    with pytest.raises(HTTPException) as error:
+        auth.verify_access_token(token)
+    assert error.value.detail == "Access token has expired"
+    assert auth.token_cache.misses == misses + 1
+
+
+def test_tokens_without_exp_are_not_memoized():
+    token = jwt.encode({"sub": "memo@example.com", "uid": 1}, auth.SECRET_KEY, algorithm=auth.ALGORITHM)
+
+    auth.verify_access_token(token)
+
+    assert auth.token_cache.stats()["size"] == 0
@@ -0,0 +1,18 @@
+import pytest
+
+from breate_backend.database import pool_limits
+
+
+@pytest.mark.parametrize(
+    "size, overflow, budget, workers, expected",
+    [
+        (5, 10, 100, 1, (5, 10)),  # fits: unchanged
+        (5, 10, 100, 4, (5, 7)),   # 12 per pool, 96 in all
+        (20, 10, 100, 4, (12, 0)),
+        (5, 10, 10, 8, (1, 0)),    # never below one connection
+    ],
+)
+def test_pools_fit_the_connection_budget(size, overflow, budget, workers, expected):
+    assert pool_limits(size, overflow, budget, workers) == expected
+    pool_size, max_overflow = expected
+    assert budget < workers * 2 or workers * 2 * (pool_size + max_overflow) <= budget
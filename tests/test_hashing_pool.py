@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from breate_backend import passwords
+from breate_backend.passwords import HashingPool
+
+SIGNUP = {"email": "busy@example.com", "password": "secret", "archetype_id": 1, "tier_id": 1}
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    """
+    Swaps in a one-thread pool; returns a function that builds it.
+    """
+    pools = []
+
+    def build(queue_limit: int, queue_timeout: float) -> HashingPool:
+        pool = HashingPool(concurrency=1, queue_limit=queue_limit, queue_timeout=queue_timeout)
+        monkeypatch.setattr(passwords, "pool", pool)
+        pools.append(pool)
+        return pool
+
+    yield build
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_full_queue_is_turned_away_with_429(client, small_pool):
+    pool = small_pool(queue_limit=1, queue_timeout=30)
+    gate = threading.Event()
+    busy = [pool.submit(gate.wait) for _ in range(2)]  # one running, one queued
+
+    try:
+        response = client.post("/api/v1/users/signup", json=SIGNUP)
+    finally:
+        gate.set()
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert pool.stats()["rejected"] == 1
+    for future in busy:
+        future.result(timeout=5)
+
+
+def test_job_that_waited_too_long_gets_503(client, small_pool):
+    pool = small_pool(queue_limit=4, queue_timeout=0.05)
+    pool.submit(time.sleep, 0.3)
+
+    response = client.post("/api/v1/users/signup", json=SIGNUP)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    assert pool.stats()["timed_out"] == 1
+
+
+def test_signup_goes_through_once_the_pool_is_free(client, small_pool):
+    small_pool(queue_limit=1, queue_timeout=30)
+
+    assert client.post("/api/v1/users/signup", json=SIGNUP).status_code == 200
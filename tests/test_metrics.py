@@ -0,0 +1,57 @@
+import os
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from prometheus_client import CollectorRegistry
+from prometheus_client.multiprocess import MultiProcessCollector
+
+GUNICORN_CONF = Path(__file__).parents[1] / "breate-backend-main" / "gunicorn.conf.py"
+
+# One "worker": a request in flight and a finished one
+WORKER = """
+import os
+from breate_backend import metrics
+metrics.IN_FLIGHT.inc()
+metrics.REQUESTS.labels("GET", "/api/v1/projects/", "2xx").inc()
+print(os.getpid())
+"""
+
+
+def run_worker(directory) -> int:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(directory)}
+    output = subprocess.run(
+        [sys.executable, "-c", WORKER], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return int(output.split()[-1])
+
+
+def scrape(directory) -> dict:
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry, path=str(directory))
+    return {
+        sample.name: sample.value
+        for metric in registry.collect()
+        for sample in metric.samples
+        if sample.name in ("breate_http_requests_in_flight", "breate_http_requests_total")
+    }
+
+
+def test_workers_are_merged_and_dead_ones_drop_out(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    first, _ = run_worker(tmp_path), run_worker(tmp_path)
+
+    assert scrape(tmp_path) == {
+        "breate_http_requests_in_flight": 2,
+        "breate_http_requests_total": 2,
+    }
+
+    runpy.run_path(str(GUNICORN_CONF))["child_exit"](None, SimpleNamespace(pid=first))
+
+    # Counters keep the dead worker's history; its live gauge is gone
+    assert scrape(tmp_path) == {
+        "breate_http_requests_in_flight": 1,
+        "breate_http_requests_total": 2,
+    }
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import insert
+
+from breate_backend import models, pagination
+from breate_backend.pagination import encode_cursor
+from conftest import make_projects, make_users
+
+FEEDS = [
+    "/api/v1/projects/",
+    "/api/v1/discover/projects",
+    "/api/v1/coalitions/1/projects",
+]
+
+
+def walk(client, url: str, limit: int) -> list[int]:
+    """
+    Follows next_cursor to the end; fails instead of looping forever.
+    """
+    ids, cursor = [], None
+    for _ in range(50):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+    pytest.fail(f"{url} never reached the last page; ids so far {ids}")
+
+
+@pytest.mark.parametrize("url", FEEDS)
+@pytest.mark.parametrize("timestamps", [False, True], ids=["server-default", "mixed-formats"])
+def test_feed_walks_every_project_once(client, db, url, timestamps):
+    project_ids = make_projects(db, 7, timestamps=timestamps)
+    db.execute(
+        insert(models.project_coalitions),
+        [{"project_id": project_id, "coalition_id": 1} for project_id in project_ids],
+    )
+    db.commit()
+
+    ids = walk(client, url, limit=2)
+
+    assert sorted(ids) == sorted(project_ids)
+    assert len(ids) == len(set(ids))
+
+
+@pytest.mark.parametrize(
+    "url, values",
+    [
+        ("/api/v1/projects/", ["2026-01-01T12:00:00", "abc"]),
+        ("/api/v1/projects/", [1700000000, 5]),
+        ("/api/v1/projects/", ["2026-01-01T12:00:00", True]),
+        ("/api/v1/projects/", ["2026-01-01T12:00:00", None]),
+        ("/api/v1/discover/users", ["5"]),
+        ("/api/v1/discover/users", [{"id": 5}]),
+        ("/api/v1/discover/users?username=user", ["high", 5]),
+        ("/api/v1/discover/projects?q=build", [[1], 5]),
+    ],
+)
+def test_mistyped_cursor_is_rejected(client, url, values):
+    response = client.get(url, params={"cursor": encode_cursor(values)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_integer_cursor_for_float_score_is_accepted(client, db):
+    make_users(db, 3)
+
+    response = client.get("/api/v1/discover/users", params={"username": "user", "cursor": encode_cursor([1, 10**9])})
+
+    assert response.status_code == 200, response.text
+
+
+def test_coalition_search_returns_only_the_best_matches(client, monkeypatch):
+    # "o" matches both seeded coalitions; University of Ghana scores higher
+    # on its focus ("Education")
+    response = client.get("/api/v1/coalitions/", params={"search": "o", "limit": 1})
+    assert [c["name"] for c in response.json()] == ["University of Ghana"]
+
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 1)
+    assert len(client.get("/api/v1/coalitions/", params={"search": "o"}).json()) == 1
+    assert len(client.get("/api/v1/coalitions/").json()) == 2
+
+
+def test_unknown_coalition_projects_is_404(client):
+    assert client.get("/api/v1/coalitions/1/projects").json()["items"] == []
+
+    response = client.get("/api/v1/coalitions/999999/projects")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Coalition not found"
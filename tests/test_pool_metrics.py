@@ -0,0 +1,59 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from breate_backend import instrumentation
+from breate_backend.instrumentation import pool_status, timed_pool, watch_pool
+from conftest import _db_dir
+
+
+@pytest.fixture
+def watched():
+    engine = create_engine(
+        f"sqlite:///{_db_dir}/pool.db",
+        pool_pre_ping=True,
+        poolclass=timed_pool("test", QueuePool),
+    )
+    watch_pool("test", engine)
+    yield engine
+    engine.dispose()
+    instrumentation.ENGINES.pop("test")
+    instrumentation.POOL_METRICS.pop("test")
+
+
+def fail_next_ping(engine):
+    ping = engine.dialect.do_ping
+
+    def dead(dbapi_connection):
+        engine.dialect.do_ping = ping
+        raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+    engine.dialect.do_ping = dead
+
+
+def test_failed_pre_ping_is_counted_separately(watched):
+    with watched.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    fail_next_ping(watched)
+
+    with watched.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    status = pool_status()["test"]
+    assert status["pre_ping_failed"] == 1
+    assert status["invalidated"] == 1
+    assert status["opened"] == 2
+
+
+def test_other_errors_are_not_pre_ping_failures(watched):
+    with watched.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM no_such_table"))
+
+    assert pool_status()["test"]["pre_ping_failed"] == 0
+
+
+def test_timed_pool_logs_under_sqlalchemy(watched):
+    assert watched.pool.logger.name.startswith("sqlalchemy.pool.")
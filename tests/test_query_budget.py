@@ -0,0 +1,98 @@
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, selectinload
+
+from breate_backend import instrumentation, models
+from breate_backend.database import SessionLocal, get_db
+from breate_backend.instrumentation import REQUEST_STATS, QueryBudgetExceeded, RequestStats, query_budget
+from conftest import make_users
+
+
+@pytest.fixture
+def budget_client():
+    """
+    Client for a throwaway app with two routes, one N+1 over User.tier and
+    one that eager-loads it, so nothing leaks into the real app or its schema.
+    """
+    test_app = FastAPI()
+
+    @test_app.middleware("http")
+    async def track_stats(request: Request, call_next):
+        token = REQUEST_STATS.set(RequestStats.start())
+        try:
+            return await call_next(request)
+        finally:
+            REQUEST_STATS.reset(token)
+
+    @test_app.get("/tiers/lazy", dependencies=[Depends(query_budget(2))])
+    def lazy_tiers(db: Session = Depends(get_db)):
+        return [user.tier.name for user in db.query(models.User).all()]
+
+    @test_app.get("/tiers/eager", dependencies=[Depends(query_budget(2))])
+    def eager_tiers(db: Session = Depends(get_db)):
+        users = db.query(models.User).options(selectinload(models.User.tier)).all()
+        return [user.tier.name for user in users]
+
+    def test_db():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    test_app.dependency_overrides[get_db] = test_db
+    with TestClient(test_app) as client:
+        yield client
+
+
+@pytest.fixture
+def budget_mode(monkeypatch):
+    monkeypatch.setattr(instrumentation, "QUERY_BUDGET_MODE", "raise")
+
+
+def test_n_plus_one_exceeds_budget(budget_client, db, budget_mode):
+    make_users(db, 6)  # spread over all three tiers
+
+    with pytest.raises(QueryBudgetExceeded, match="last lazy load: User.tier"):
+        budget_client.get("/tiers/lazy")
+
+
+def test_lazy_raise_rejects_lazy_load(budget_client, db, monkeypatch):
+    monkeypatch.setattr(instrumentation, "ORM_LAZY_RAISE", True)
+    make_users(db, 2)
+
+    with pytest.raises(InvalidRequestError, match="User.tier"):
+        budget_client.get("/tiers/lazy")
+
+
+def test_lazy_raise_allows_explicit_eager_load(budget_client, db, monkeypatch):
+    monkeypatch.setattr(instrumentation, "ORM_LAZY_RAISE", True)
+    make_users(db, 2)
+
+    assert budget_client.get("/tiers/eager").status_code == 200
+
+
+def test_eager_load_within_budget_passes(budget_client, db, budget_mode):
+    make_users(db, 6)
+
+    assert budget_client.get("/tiers/eager").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/discover/users",
+        "/api/v1/discover/projects",
+        "/api/v1/projects/",
+        "/api/v1/coalitions/",
+        "/api/v1/coalitions/1",
+        "/api/v1/coalitions/1/projects",
+        "/api/v1/profile/user0",
+    ],
+)
+def test_routes_within_budget_pass(client, db, budget_mode, url):
+    make_users(db, 6)
+
+    assert client.get(url).status_code == 200
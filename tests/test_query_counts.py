@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import insert
+
+from breate_backend import models
+from conftest import make_users
+
+
+def count_statements(client, queries, url: str) -> int:
+    queries.reset()
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return len(queries)
+
+
+def add_members(db, count: int, prefix: str):
+    user_ids = make_users(db, count, prefix=prefix)
+    db.execute(
+        insert(models.coalition_members),
+        [{"coalition_id": 1, "user_id": user_id} for user_id in user_ids],
+    )
+    db.commit()
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("/api/v1/discover/users", 1),
+        ("/api/v1/discover/users?limit=50", 1),
+        ("/api/v1/coalitions/1", 2),
+        ("/api/v1/coalitions/1/projects", 2),  # empty page: coalition looked up
+        ("/api/v1/profile/user0", 1),
+    ],
+)
+def test_statement_count_does_not_grow_with_rows(client, db, queries, url, expected):
+    add_members(db, 10, prefix="user")
+    few = count_statements(client, queries, url)
+
+    add_members(db, 40, prefix="more")
+    many = count_statements(client, queries, url)
+
+    assert few == many == expected
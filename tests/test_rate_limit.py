@@ -0,0 +1,158 @@
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from breate_backend import rate_limit
+from breate_backend.main import app
+from breate_backend.rate_limit import MemoryBackend, Rate, SharedAddressCheck, client_ip
+from conftest import signup_and_login
+
+
+def request_from(peer: str, forwarded: list[str] = ()) -> Request:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded]
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "trusted, forwarded, expected",
+    [
+        (0, ["203.0.113.9"], "10.0.0.7"),
+        (1, ["203.0.113.9"], "203.0.113.9"),
+        (1, ["1.1.1.1, 203.0.113.9"], "203.0.113.9"),  # spoofed entry on the left
+        (1, ["1.1.1.1", "203.0.113.9"], "203.0.113.9"),  # repeated header
+        (2, ["203.0.113.9, 10.0.0.8"], "203.0.113.9"),
+        (2, ["203.0.113.9"], "10.0.0.7"),  # fewer hops than configured
+        (1, [], "10.0.0.7"),
+    ],
+)
+def test_client_ip(monkeypatch, trusted, forwarded, expected):
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_TRUSTED_PROXIES", trusted)
+
+    assert client_ip(request_from("10.0.0.7", forwarded)) == expected
+
+
+def test_clients_behind_the_proxy_get_their_own_limit(client, monkeypatch):
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_TRUSTED_PROXIES", 1)
+    monkeypatch.setattr(rate_limit, "LOGIN_PER_IP", Rate(2, 60))
+    behind_proxy = TestClient(app, client=("10.0.0.7", 1234))
+
+    def login(address: str) -> int:
+        return behind_proxy.post(
+            "/api/v1/users/login",
+            data={"username": f"{address}@example.com", "password": "x"},
+            headers={"X-Forwarded-For": address},
+        ).status_code
+
+    assert [login("203.0.113.9") for _ in range(3)] == [401, 401, 429]
+    assert login("198.51.100.4") == 401
+
+
+@pytest.mark.parametrize(
+    "addresses, warns",
+    [
+        (["10.0.0.7"] * 3, True),
+        (["10.0.0.7", "10.0.0.7", "10.0.0.8"], False),
+        (["8.8.8.8"] * 3, False),
+        (["127.0.0.1"] * 3, False),
+        (["10.0.0.7"] * 2, False),  # sample not complete yet
+    ],
+)
+def test_shared_private_address_warns_once(caplog, addresses, warns):
+    check = SharedAddressCheck(sample=3)
+
+    with caplog.at_level(logging.WARNING, logger="breate.rate_limit"):
+        for address in addresses + ["10.0.0.7"] * 5 * warns:
+            check.observe(address)
+
+    assert len(caplog.records) == warns
+
+
+class Clock:
+    """
+    Stands in for the time module inside rate_limit.
+    """
+
+    def __init__(self):
+        self.now = 999_960.0  # start of a 60 s window
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    monkeypatch.setattr(rate_limit, "LOGIN_PER_EMAIL", Rate(3, 60))
+    return clock
+
+
+def login(client, password: str, email: str = "victim@example.com") -> int:
+    return client.post("/api/v1/users/login", data={"username": email, "password": password}).status_code
+
+
+def test_correct_logins_do_not_use_up_the_account_limit(client, clock):
+    signup_and_login(client, "victim@example.com", "right")
+
+    assert [login(client, "right") for _ in range(5)] == [200] * 5
+
+
+def test_victim_gets_in_after_the_attackers_lockout(client, clock):
+    signup_and_login(client, "victim@example.com", "right")
+    attacker = TestClient(app, client=("198.51.100.4", 1234))
+
+    assert [login(attacker, "guess") for _ in range(13)] == [401] * 3 + [429] * 10
+
+    # The three failures have partly slid out of the window; the ten
+    # refused attempts were never counted, so the lockout is over
+    clock.now += 70
+
+    assert login(client, "right") == 200
+
+
+def test_lockout_refuses_before_hashing(client, clock, monkeypatch):
+    signup_and_login(client, "victim@example.com", "right")
+    for _ in range(3):
+        login(client, "guess")
+
+    async def fail(*args):
+        raise AssertionError("hashed a locked-out login")
+
+    monkeypatch.setattr("breate_backend.routers.user.verify_and_update", fail)
+
+    assert login(client, "right") == 429
+
+
+class LoopSpyBackend(MemoryBackend):
+    """
+    Records whether each call ran on the event loop's thread.
+    """
+
+    def __init__(self, blocking: bool):
+        super().__init__()
+        self.blocking = blocking
+        self.on_loop = []
+
+    def get(self, key):
+        try:
+            asyncio.get_running_loop()
+            self.on_loop.append(True)
+        except RuntimeError:
+            self.on_loop.append(False)
+        return super().get(key)
+
+
+@pytest.mark.parametrize("blocking", [True, False])
+def test_blocking_backends_run_off_the_event_loop(client, monkeypatch, blocking):
+    backend = LoopSpyBackend(blocking)
+    monkeypatch.setattr(rate_limit.limiter, "backend", backend)
+
+    login(client, "guess", email="nobody@example.com")
+
+    assert backend.on_loop and set(backend.on_loop) == {not blocking}
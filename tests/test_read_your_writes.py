@@ -0,0 +1,61 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from breate_backend import database, main, models
+from breate_backend.database import READ_STICKY_COOKIE
+from conftest import _db_dir, signup_and_login
+
+NEW_PROJECT = {
+    "title": "Replica lag",
+    "objective": "Read it back",
+    "project_type": "app",
+    "needed_archetypes": ["Creator"],
+}
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """
+    An empty second database standing in for a replica that has not
+    caught up yet; public reads go there unless the client is sticky.
+    """
+    url = f"sqlite:///{_db_dir}/replica.db"
+    sync_engine = create_engine(url)
+    async_engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"))
+    models.Base.metadata.create_all(sync_engine)
+
+    monkeypatch.setattr(main, "DATABASE_READ_URL", url)
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=sync_engine))
+    monkeypatch.setattr(
+        database,
+        "AsyncReadSessionLocal",
+        async_sessionmaker(async_engine, expire_on_commit=False),
+    )
+    yield
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def https_client(client):
+    # Secure cookies only travel over https
+    return TestClient(main.app, base_url="https://testserver")
+
+
+def test_read_after_write_is_served_from_primary(https_client, replica):
+    headers = signup_and_login(https_client)
+    created = https_client.post("/api/v1/projects/", json=NEW_PROJECT, headers=headers)
+    assert created.status_code == 201
+
+    cookie = created.headers["set-cookie"].lower()
+    assert READ_STICKY_COOKIE in cookie
+    assert "samesite=none" in cookie and "secure" in cookie
+
+    project_id = created.json()["id"]
+    assert https_client.get(f"/api/v1/projects/{project_id}").status_code == 200
+
+    # Without the cookie the read goes to the (stale) replica
+    https_client.cookies.clear()
+    assert https_client.get(f"/api/v1/projects/{project_id}").status_code == 404
@@ -0,0 +1,72 @@
+import io
+import json
+
+import pytest
+
+from breate_backend import instrumentation, request_log
+from conftest import signup_and_login
+
+
+@pytest.fixture
+def log_lines(monkeypatch):
+    """
+    Logs every request, with all headers, and returns a function giving
+    the lines the listener thread has written so far.
+    """
+    monkeypatch.setattr(request_log, "REQUEST_LOG_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(request_log, "REQUEST_LOG_HEADERS", {"*"})
+    monkeypatch.setattr(instrumentation, "SQL_TIMING_SAMPLE_RATE", 1.0)
+    output = io.StringIO()
+    monkeypatch.setattr(request_log._stream, "stream", output)
+
+    def lines() -> list[str]:
+        request_log._queue.join()
+        return output.getvalue().splitlines()
+
+    return lines
+
+
+def test_slowest_statement_is_logged_normalized(client, log_lines, monkeypatch):
+    monkeypatch.setattr(request_log, "REQUEST_LOG_SQL_CHARS", 40)
+
+    client.get("/api/v1/coalitions/1")
+
+    [line] = [json.loads(line) for line in log_lines()]
+    assert line["route"] == "/api/v1/coalitions/{coalition_id}"
+    assert line["db_slowest_sql"].startswith("SELECT ")
+    assert len(line["db_slowest_sql"]) == 40
+    assert "\n" not in line["db_slowest_sql"]
+
+
+def test_no_statements_logs_no_sql(client, log_lines):
+    client.get("/health")
+
+    [line] = [json.loads(line) for line in log_lines()]
+    assert line["db_slowest_sql"] is None
+
+
+def test_credentials_never_reach_the_log(client, log_lines):
+    headers = signup_and_login(client, "logged@example.com", "secret")
+    login = client.post("/api/v1/users/login", data={"username": "logged@example.com", "password": "secret"})
+    refresh_token = login.cookies["refresh_token"]
+    access_token = headers["Authorization"].split()[1]
+
+    client.get(
+        "/api/v1/users/me",
+        headers={
+            **headers,
+            "Cookie": f"refresh_token={refresh_token}",
+            "Set-Cookie": f"refresh_token={refresh_token}",
+            "Proxy-Authorization": "Basic c2VjcmV0",
+            "X-Api-Key": "key-secret",
+        },
+    )
+
+    output = "\n".join(log_lines())
+    for secret in (access_token, refresh_token, "c2VjcmV0", "key-secret", "secret"):
+        assert secret not in output
+
+    me = [json.loads(line) for line in log_lines() if '"/api/v1/users/me"' in line][-1]
+    for name in ("authorization", "cookie", "set-cookie", "proxy-authorization", "x-api-key"):
+        assert me["headers"][name] == "[redacted]"
+    assert me["status"] == 200
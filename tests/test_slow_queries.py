@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import select
+
+from breate_backend import instrumentation, models, slow_queries
+from breate_backend.database import async_engine, engine
+from breate_backend.instrumentation import REQUEST_STATS, RequestStats
+
+
+def wait_for_explain():
+    deadline = time.monotonic() + 5
+    while not slow_queries._explaining.acquire(blocking=False):
+        assert time.monotonic() < deadline, "EXPLAIN never finished"
+        time.sleep(0.01)
+    slow_queries._explaining.release()
+
+
+@pytest.fixture
+def explain_everything(monkeypatch):
+    monkeypatch.setattr(slow_queries, "SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(slow_queries, "SLOW_QUERY_EXPLAIN_RATE", 1.0)
+    monkeypatch.setattr(instrumentation, "QUERY_BUDGET_MODE", "raise")
+    slow_queries.entries.clear()
+    yield
+    wait_for_explain()
+    slow_queries.entries.clear()
+
+
+@pytest.fixture
+def stats():
+    stats = RequestStats(sampled=True, query_budget=1)
+    token = REQUEST_STATS.set(stats)
+    yield stats
+    REQUEST_STATS.reset(token)
+
+
+def test_sync_explain_is_not_counted_against_the_request(explain_everything, stats):
+    with engine.connect() as conn:
+        conn.execute(select(models.Tier.id)).all()
+    wait_for_explain()
+
+    assert stats.queries == 1
+    assert any(entry["plan"] for entry in slow_queries.recent())
+
+
+def test_async_explain_is_not_counted_against_the_request(explain_everything, stats):
+    async def run():
+        async with async_engine.connect() as conn:
+            (await conn.execute(select(models.Tier.id))).all()
+        # Let the EXPLAIN task finish on this loop
+        while slow_queries._tasks:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert stats.queries == 1
+    assert any(entry["plan"] for entry in slow_queries.recent())
@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from breate_backend import bootstrap
+
+
+@pytest.fixture
+def warming_up(client, monkeypatch):
+    """
+    Puts the running app back into warm-up; returns a function that
+    finishes it.
+    """
+    done = asyncio.Event()
+    monkeypatch.setattr(bootstrap.startup, "ready", False)
+    monkeypatch.setattr(bootstrap.startup, "done", done)
+
+    def finish():
+        bootstrap.startup.ready = True
+        client.portal.call(done.set)
+
+    return finish
+
+
+def test_readiness_fails_until_warm_up_finishes(client, warming_up):
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+    warming_up()
+
+    assert client.get("/health/ready").status_code == 200
+
+
+def test_requests_wait_for_warm_up(client, warming_up):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(client.get, "/api/v1/tiers/")
+        with pytest.raises(TimeoutError):
+            pending.result(timeout=0.3)
+
+        # Health checks are never held
+        assert client.get("/health").status_code == 200
+
+        warming_up()
+        assert pending.result(timeout=5).status_code == 200
+
+
+def test_requests_give_up_after_the_startup_wait(client, warming_up, monkeypatch):
+    monkeypatch.setattr(bootstrap, "STARTUP_WAIT_SECONDS", 0.05)
+
+    response = client.get("/api/v1/tiers/")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
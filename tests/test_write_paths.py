@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import create_engine, event, insert, text, update
+from sqlalchemy.exc import IntegrityError
+
+from breate_backend import models
+from breate_backend.database import engine
+from breate_backend.queries import is_unique_violation
+from conftest import signup_and_login
+
+PROJECT = {
+    "title": "Mural",
+    "objective": "Paint the hall",
+    "project_type": "art",
+    "needed_archetypes": ["Creative"],
+}
+
+
+@pytest.fixture
+def owner(client) -> dict:
+    return signup_and_login(client, "owner@example.com", "secret")
+
+
+@pytest.fixture
+def project_id(client, owner) -> int:
+    response = client.post("/api/v1/projects/", json=PROJECT, headers=owner)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def set_status(client, project_id: int, status: str, headers: dict):
+    return client.patch(f"/api/v1/projects/{project_id}/status", json={"status": status}, headers=headers)
+
+
+def test_duplicate_email_signup_is_rejected(client):
+    body = {"email": "twice@example.com", "password": "secret", "archetype_id": 1, "tier_id": 1}
+    assert client.post("/api/v1/users/signup", json=body).status_code == 200
+
+    response = client.post("/api/v1/users/signup", json=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_duplicate_email_past_the_conflict_clause_is_still_reported(client, monkeypatch):
+    # As if the ON CONFLICT target missed the duplicate (e.g. a race on a
+    # dialect without it): the unique violation must not read as a bad FK
+    monkeypatch.setattr("breate_backend.routers.user.insert_or_skip", lambda db, table, conflict_on: insert(table))
+    body = {"email": "race@example.com", "password": "secret", "archetype_id": 1, "tier_id": 1}
+    assert client.post("/api/v1/users/signup", json=body).status_code == 200
+
+    response = client.post("/api/v1/users/signup", json=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_unique_violations_are_told_apart_from_foreign_keys():
+    scratch = create_engine("sqlite://")
+    with scratch.connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+        conn.exec_driver_sql("CREATE TABLE tiers (id INTEGER PRIMARY KEY)")
+        conn.exec_driver_sql(
+            "CREATE TABLE users (email TEXT UNIQUE, tier_id INTEGER REFERENCES tiers (id))"
+        )
+        conn.exec_driver_sql("INSERT INTO users (email) VALUES ('a@example.com')")
+
+        with pytest.raises(IntegrityError) as duplicate:
+            conn.execute(text("INSERT INTO users (email) VALUES ('a@example.com')"))
+        with pytest.raises(IntegrityError) as unknown_tier:
+            conn.execute(text("INSERT INTO users (email, tier_id) VALUES ('b@example.com', 9)"))
+
+    assert is_unique_violation(duplicate.value)
+    assert not is_unique_violation(unknown_tier.value)
+
+
+def test_collab_request_for_missing_user_is_404(client, owner):
+    response = client.post("/api/v1/collabcircle/", json={"collaborator_username": "nobody"}, headers=owner)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
+
+
+def test_status_flow(client, owner, project_id):
+    assert set_status(client, project_id, "in_progress", owner).json()["status"] == "in_progress"
+    assert set_status(client, project_id, "completed", owner).json()["status"] == "completed"
+
+
+def test_invalid_status_transition_is_rejected(client, owner, project_id):
+    response = set_status(client, project_id, "completed", owner)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid status transition: open → completed"
+
+
+def test_status_changed_underneath_is_a_conflict(client, owner, project_id):
+    # Another request moves the project on between this request's UPDATE
+    # (which then matches nothing) and its follow-up lookup
+    fired = []
+
+    def concurrent_update(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE projects") and not fired:
+            fired.append(statement)
+            conn.execute(
+                update(models.Project)
+                .where(models.Project.id == project_id)
+                .values(status=models.ProjectStatus.in_progress)
+            )
+
+    event.listen(engine, "after_cursor_execute", concurrent_update)
+    try:
+        response = set_status(client, project_id, "completed", owner)
+    finally:
+        event.remove(engine, "after_cursor_execute", concurrent_update)
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Project status changed, reload and retry"
+
+
+def test_status_of_missing_project_is_404(client, owner):
+    assert set_status(client, 999_999, "in_progress", owner).status_code == 404
+
+
+def test_status_of_someone_elses_project_is_403(client, project_id):
+    other = signup_and_login(client, "other@example.com", "secret")
+
+    assert set_status(client, project_id, "in_progress", other).status_code == 403